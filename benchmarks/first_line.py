@@ -0,0 +1,57 @@
+"""Time to the first block of split text, for a long text seen for the first time.
+
+Compares what the page used to do (split everything, then write it in one
+piece) with splitting line by line while writing blocks. Also counts the
+messages each way sends to the browser with "Line by line with input
+text" on (one per line before).
+
+    python benchmarks/first_line.py [file]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from line_memo import CHANTS  # noqa: E402
+from palijuncture import SplitOptions, split_text  # noqa: E402
+from palijuncture.blocks import line_by_line, markdown_blocks  # noqa: E402
+from palijuncture.incremental import LineSplits  # noqa: E402
+
+
+def first_and_total(blocks):
+    start = time.perf_counter()
+    first = None
+    count = 0
+    for _ in blocks:
+        count += 1
+        if first is None:
+            first = time.perf_counter() - start
+    return first * 1000, (time.perf_counter() - start) * 1000, count
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        with open(argv[0], encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = "\n".join(f"{line} {i}" if line else line for i, line in enumerate((CHANTS * 100).split("\n")[:2000]))
+    options = SplitOptions()
+    split_text("x", options)  # compile outside the timings
+
+    whole = first_and_total(split_text(text, options) for _ in range(1))
+    lines = first_and_total(markdown_blocks(LineSplits().iter_split(text, options)))
+    pairs = markdown_blocks(line_by_line(text, LineSplits().iter_split(text, options)), can_end=lambda pair: True)
+    _, _, pair_blocks = first_and_total(pairs)
+
+    print(f"{text.count(chr(10)) + 1:,} lines, {len(text):,} characters, new to every cache")
+    print(f"whole text, one write:     first line {whole[0]:7.1f} ms, all {whole[1]:7.1f} ms")
+    print(f"line by line, {lines[2]:3} blocks:  first line {lines[0]:7.1f} ms, all {lines[1]:7.1f} ms")
+    print(f"with input text: {pair_blocks} writes instead of {text.count(chr(10)) + 1:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
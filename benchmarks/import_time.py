@@ -0,0 +1,52 @@
+"""Measure the cold import time of the core splitter.
+
+Each run imports ``palijuncture`` in a fresh interpreter, so nothing is
+cached in ``sys.modules``. It also checks that none of the page's heavy
+dependencies are pulled in on the way.
+
+    python benchmarks/import_time.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = 100
+HEAVY = ("streamlit", "altair", "pandas", "numpy")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import palijuncture
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "heavy": sorted(m for m in %r if m in sys.modules)}))
+""" % (HEAVY,)
+
+
+def measure(runs: int = 10):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        result = json.loads(out)
+        if result["heavy"]:
+            raise SystemExit(f"palijuncture imports {', '.join(result['heavy'])}")
+        times.append(result["ms"])
+    return times
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    runs = int(argv[0]) if argv else 10
+    times = measure(runs)
+    median = statistics.median(times)
+    print(f"import palijuncture: median {median:.1f} ms, min {min(times):.1f} ms, "
+          f"max {max(times):.1f} ms over {runs} runs (budget {BUDGET_MS} ms)")
+    return 0 if median < BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Rerun latency after a one-character edit, whole text versus changed lines.
+
+Builds a document of 2,000 lines (or takes a file), then edits one
+character in a different line at a time and splits again, once with
+``split_text`` and once with a LineSplits kept between the edits.
+
+    python benchmarks/incremental.py [file]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from line_memo import CHANTS  # noqa: E402
+from palijuncture import split_text  # noqa: E402
+from palijuncture.incremental import LineSplits  # noqa: E402
+
+EDITS = 50
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        with open(argv[0], encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    else:
+        lines = [f"{line} {i}" for i, line in enumerate((CHANTS * 100).split("\n")[:2000])]
+    line_splits = LineSplits()
+    line_splits.split("\n".join(lines), split_text=split_text)
+
+    whole, incremental = [], []
+    for edit in range(EDITS):
+        i = (edit * 37) % len(lines)
+        lines[i] += "ā"
+        text = "\n".join(lines)
+        start = time.perf_counter()
+        expected = split_text(text)
+        whole.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        result = line_splits.split(text, split_text=split_text)
+        incremental.append((time.perf_counter() - start) * 1000)
+        assert result == expected, f"edit {edit} differs"
+
+    print(f"{len(lines):,} lines, {len(text):,} characters, {EDITS} one-character edits")
+    print(f"whole text:    median {statistics.median(whole):7.2f} ms, max {max(whole):7.2f} ms")
+    print(f"changed lines: median {statistics.median(incremental):7.2f} ms, max {max(incremental):7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
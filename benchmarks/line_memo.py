@@ -0,0 +1,81 @@
+"""Hit rate and throughput of the line memo on a corpus.
+
+Splits every file given on the command line (or a short built-in set of
+daily chants) with and without a LineMemo, and reports the hit rate and
+characters per second of each.
+
+    python benchmarks/line_memo.py [file ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from palijuncture import LineMemo, SplitOptions  # noqa: E402
+from palijuncture.engine import split_core  # noqa: E402
+
+CHANTS = """Namo tassa bhagavato arahato sammāsambuddhassa.
+Namo tassa bhagavato arahato sammāsambuddhassa.
+Namo tassa bhagavato arahato sammāsambuddhassa.
+
+Buddhaṃ saraṇaṃ gacchāmi.
+Dhammaṃ saraṇaṃ gacchāmi.
+Saṅghaṃ saraṇaṃ gacchāmi.
+Dutiyampi buddhaṃ saraṇaṃ gacchāmi.
+Dutiyampi dhammaṃ saraṇaṃ gacchāmi.
+Dutiyampi saṅghaṃ saraṇaṃ gacchāmi.
+Tatiyampi buddhaṃ saraṇaṃ gacchāmi.
+Tatiyampi dhammaṃ saraṇaṃ gacchāmi.
+Tatiyampi saṅghaṃ saraṇaṃ gacchāmi.
+
+Yānīdha bhūtāni samāgatāni,
+bhummāni vā yāni va antalikkhe;
+Sabbeva bhūtā sumanā bhavantu,
+Atho pi sakkacca suṇantu bhāsitaṃ.
+
+Yaṃ kiñci vittaṃ idha vā huraṃ vā,
+Saggesu vā yaṃ ratanaṃ paṇītaṃ;
+Na no samaṃ atthi tathāgatena,
+Idampi buddhe ratanaṃ paṇītaṃ;
+Etena saccena suvatthi hotu.
+"""
+
+
+def run(texts, options, memo=None):
+    chars = sum(len(text) for text in texts)
+    start = time.perf_counter()
+    for text in texts:
+        if memo is None:
+            split_core(text, options)
+        else:
+            memo.split_core(text, options)
+    return chars / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    texts = []
+    for path in argv:
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+    if not texts:
+        texts = [CHANTS] * 20
+    options = SplitOptions()
+    split_core("x", options)  # compile outside the timings
+
+    plain = run(texts, options)
+    memo = LineMemo()
+    cold = run(texts, options, memo)
+    cold_stats = memo.stats()
+    warm = run(texts, options, memo)
+    print(f"{sum(map(len, texts)):,} characters in {len(texts)} texts")
+    print(f"no memo:   {plain:>12,.0f} chars/s")
+    print(f"cold memo: {cold:>12,.0f} chars/s, hit rate {cold_stats['hit_rate']:.1%}")
+    print(f"warm memo: {warm:>12,.0f} chars/s, hit rate {memo.stats()['hit_rate']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Load test for the HTTP service on localhost.
+
+Starts ``python -m palijuncture.service`` on a free port (or uses a
+running one with ``--url``), sends it many small ``/split`` requests from
+concurrent clients, and reports requests per second, client-side latency
+percentiles and the service's own ``/stats``.
+
+    python benchmarks/load_test.py [--clients 32] [--requests 2000] [--jobs 2]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from line_memo import CHANTS  # noqa: E402
+from palijuncture.service import percentiles  # noqa: E402
+
+LINES = [line for line in CHANTS.splitlines() if line]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(host: str, port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"the service did not come up on {host}:{port}")
+
+
+def client(host: str, port: int, count: int, seed: int, latencies: list, failures: list):
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    for _ in range(count):
+        text = "\n".join(rng.sample(LINES, rng.randint(1, 4)))
+        body = json.dumps({"text": text, "options": {"uppercase": rng.random() < 0.2}})
+        start = time.perf_counter()
+        connection.request("POST", "/split", body, {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status != 200:
+            failures.append(response.status)
+    connection.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="a service that is already running, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="in total, over all clients")
+    parser.add_argument("--jobs", type=int, default=2, help="workers of the service this script starts")
+    args = parser.parse_args(argv)
+
+    service = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        service = subprocess.Popen([sys.executable, "-m", "palijuncture.service", "--port", str(port),
+                                    "--jobs", str(args.jobs)], cwd=ROOT)
+    try:
+        wait_until_up(host, port)
+        client(host, port, 20, 0, [], [])  # warm up the workers
+        latencies, failures = [], []
+        per_client = max(1, args.requests // args.clients)
+        threads = [threading.Thread(target=client, args=(host, port, per_client, seed, latencies, failures))
+                   for seed in range(args.clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        connection = http.client.HTTPConnection(host, port, timeout=10)
+        connection.request("GET", "/stats")
+        stats = json.loads(connection.getresponse().read())
+        connection.close()
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f} s "
+          f"({len(latencies) / elapsed:,.0f} requests/s), {len(failures)} failed")
+    print("client latency ms:", percentiles(latencies))
+    print("service latency ms:", stats["latency_ms"].get("/split"))
+    print("batches:", stats["batches"])
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
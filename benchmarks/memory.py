@@ -0,0 +1,60 @@
+"""Check that splitting a large text stays within a small multiple of its size.
+
+The old replace chain kept every intermediate copy of the text alive until
+the page was rendered. The engine only holds the text it started from and
+the one it is working on, so the peak should not grow with the number of
+rules.
+
+    python benchmarks/memory.py [megabytes]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from palijuncture import SplitOptions, split_text  # noqa: E402
+from palijuncture.engine import compile_plan  # noqa: E402
+
+# Peak traced memory allowed, as a multiple of the input string's size
+MAX_RATIO = 10
+
+STANZA = (
+    "Yānīdha bhūtāni samāgatāni\n"
+    "bhummāni vā yāni va antalikkhe\n"
+    "sabbeva bhūtā sumanā bhavantu.\n"
+    "Atho pi sakkacca suṇantu bhāsitaṃ.\n"
+)
+
+
+def peak_ratio(text: str, options: SplitOptions) -> float:
+    compile_plan(options)  # the compiled rules are shared, not per text
+    tracemalloc.start()
+    try:
+        split_text(text, options)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / sys.getsizeof(text)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    megabytes = float(argv[0]) if argv else 1
+    text = STANZA * int(megabytes * 2 ** 20 / len(STANZA.encode("utf-8")))
+    worst = 0.0
+    for label, options in (
+        ("default", SplitOptions()),
+        ("uppercase, punctuation", SplitOptions(uppercase=True, show_punctuation=True)),
+        ("saṃyoga, velthuis", SplitOptions(samyoga_pauses=True, transliteration="velthuis")),
+    ):
+        ratio = peak_ratio(text, options)
+        worst = max(worst, ratio)
+        print(f"{label}: peak {ratio:.1f}x input")
+    print(f"worst peak {worst:.1f}x input for {len(text):,} characters (limit {MAX_RATIO}x)")
+    return 0 if worst <= MAX_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
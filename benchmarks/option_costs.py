@@ -0,0 +1,76 @@
+"""Show what each sidebar option costs on top of the defaults.
+
+For every option the table lists the rules that are compiled in, the
+passes over the text they are merged into, the time to split a sample
+text, and the time to redo only the output stages on a cached core split
+(what toggling a display option costs on the page). Rule groups for
+options that are off are not compiled at all.
+
+    python benchmarks/option_costs.py [repeat]
+"""
+
+import os
+import sys
+import timeit
+from dataclasses import replace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from palijuncture import SplitOptions, split_text  # noqa: E402
+from palijuncture.engine import compile_plan, finish_split, split_core  # noqa: E402
+
+TEXT = (
+    "Yānīdha bhūtāni samāgatāni\n"
+    "bhummāni vā yāni va antalikkhe\n"
+    "sabbeva bhūtā sumanā bhavantu.\n"
+    "Atho pi sakkacca suṇantu bhāsitaṃ.\n"
+    "BUDDHAṂ SARAṆAṂ GACCHĀMI, DHAMMAṂ SARAṆAṂ GACCHĀMI.\n"
+) * 50
+
+VARIANTS = (
+    ("defaults", {}),
+    ("show_punctuation", {"show_punctuation": True}),
+    ("hide_hyphens", {"hide_hyphens": True}),
+    ("uppercase", {"uppercase": True}),
+    ("samyoga_pauses", {"samyoga_pauses": True}),
+    ("transliteration=iast", {"transliteration": "iast"}),
+    ("transliteration=iso", {"transliteration": "iso"}),
+    ("transliteration=velthuis", {"transliteration": "velthuis"}),
+    ("nasal_nn", {"nasal_nn": True}),
+    ("nasal_ng", {"nasal_ng": True}),
+    ("niggahita=ng", {"niggahita": "ng"}),
+    ("niggahita=m", {"niggahita": "m"}),
+    ("v_w=conjunct", {"v_w": "conjunct"}),
+    ("v_w=v_to_w", {"v_w": "v_to_w"}),
+    ("v_w=w_to_v", {"v_w": "w_to_v"}),
+    ("medial_nasal", {"medial_nasal": True}),
+)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    repeat = int(argv[0]) if argv else 20
+    base = SplitOptions()
+    variants = [(label, replace(base, **changes)) for label, changes in VARIANTS]
+    for _, options in variants:  # compile and warm up before timing
+        split_text(TEXT, options)
+    rows = []
+    for label, options in variants:
+        plan = compile_plan(options)
+        rules = sum(len(step.rules) for step in plan)
+        seconds = min(timeit.repeat(lambda: split_text(TEXT, options), number=1, repeat=repeat))
+        core = split_core(TEXT, options)
+        output = min(timeit.repeat(lambda: finish_split(core, TEXT, options), number=1, repeat=repeat))
+        rows.append((label, rules, len(plan), seconds * 1000, output * 1000))
+
+    base_ms = rows[0][3]
+    print(f"{len(TEXT):,} characters, best of {repeat}\n")
+    print(f"{'option':<26} {'rules':>6} {'passes':>7} {'ms':>8} {'+ms':>7} {'output ms':>10}")
+    for label, rules, passes, ms, output_ms in rows:
+        extra = "" if label == "defaults" else f"{ms - base_ms:+7.2f}"
+        print(f"{label:<26} {rules:>6} {passes:>7} {ms:>8.2f} {extra:>7} {output_ms:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""Check a splitter against the original replace chain, byte for byte.
+
+The reference is the page's first ``animation_demo()``, kept as it was in
+``benchmarks/legacy_chain.py``. A candidate splitter, by default
+:func:`palijuncture.split_text`, is run next to it on
+
+* the fixtures in ``benchmarks/fixtures`` with every option combination
+  the sidebar allows (``--quick``: one option at a time),
+* random Pāḷi-like texts built from syllables, punctuation, numbers,
+  SuttaCentral notes and stray characters, each with random options.
+
+Any text on which the two differ is shrunk, by dropping lines, then words,
+then characters and by setting options back to their defaults while the
+outputs still differ, and the smallest failing case is printed. The exit
+status is 1 if there was any mismatch.
+
+    python benchmarks/oracle.py [--quick] [--cases N] [--seed N]
+    python benchmarks/oracle.py --candidate split_lines
+    python benchmarks/oracle.py --candidate mypackage.fast:split
+
+A candidate is one of :data:`CANDIDATES` or ``module:function``, called as
+``function(text, options)``. Cases in :data:`KNOWN_DEVIATIONS`, where the
+engine deliberately differs from the chain, are skipped and counted by
+kind. A juncture sign that collides with the rules only counts as one
+where it really changed the chain's output: the chain is run again with a
+neutral sign, put back afterwards, to tell.
+"""
+
+import argparse
+import importlib
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import fields, replace
+from typing import Callable, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from legacy_chain import legacy_split  # noqa: E402
+from palijuncture import LineMemo, SplitOptions, split_lines, split_text  # noqa: E402
+from palijuncture.options import DEFAULT_JUNCTURE_SIGN  # noqa: E402
+from palijuncture.rules import JUNCTURE, STAGES  # noqa: E402
+from suite import CHOICES, FIXTURES, all_combinations, load_fixtures, one_at_a_time  # noqa: E402
+
+Splitter = Callable[[str, SplitOptions], str]
+
+_MEMO = LineMemo()
+CANDIDATES = {
+    "split_text": split_text,
+    "split_lines": lambda text, options: "".join(split_lines(text.splitlines(keepends=True) or [""], options)),
+    "line_memo": lambda text, options: "".join(
+        split_lines(text.splitlines(keepends=True) or [""], options, memo=_MEMO)),
+}
+
+# Every character a rule matches or writes
+RULE_CHARACTERS = frozenset(
+    "".join(old + new for stage in STAGES if not isinstance(stage, str) for old, new in stage.rules)) - {JUNCTURE}
+# A sign no text or rule has, for running the chain without a collision
+NEUTRAL_SIGN = "\ue001"
+
+
+def sign_collision(text: str, options: SplitOptions) -> bool:
+    """Whether the chain's own output changes because its sign has characters the rules match or write."""
+    sign = options.juncture_sign
+    if not sign or RULE_CHARACTERS.isdisjoint(sign) or NEUTRAL_SIGN in text:
+        return False
+    neutral = legacy_split(text, replace(options, juncture_sign=NEUTRAL_SIGN)).replace(NEUTRAL_SIGN, sign)
+    return legacy_split(text, options) != neutral
+
+
+# Where the engine differs from the chain on purpose: it splits with a private-use
+# marker and only puts the juncture sign in at the end (see palijuncture.rules)
+KNOWN_DEVIATIONS = (
+    ('the juncture sign "-" with "Hide hyphens and apostrophes" (the chain deleted every sign)',
+     lambda text, options: options.juncture_sign == "-" and options.hide_hyphens),
+    ("a juncture sign that is also in the text (the chain took it for one it had put in)",
+     lambda text, options: (options.juncture_sign or DEFAULT_JUNCTURE_SIGN) in text),
+    ("the engine's juncture marker in the text itself",
+     lambda text, options: JUNCTURE in text),
+    ('a juncture sign with characters the rules match or write, e.g. "?", ".", "—" or "“" (the chain ran its '
+     "later rules over the signs it had put in, even with the sign nowhere in the text)",
+     sign_collision),
+)
+# Custom signs for the random cases, some of them colliding with the rules;
+# the fixtures use CHOICES from suite.py
+SIGNS = (DEFAULT_JUNCTURE_SIGN, "-", "|", "•", "/", "", "?", "!", ":", ";", ".", "—", "–", "…", "“")
+
+ONSETS = ("", "", "k", "kh", "g", "gh", "ṅ", "c", "ch", "j", "jh", "ñ", "ṭ", "ṭh", "ḍ", "ḍh", "ṇ", "t", "th", "d",
+          "dh", "n", "p", "ph", "b", "bh", "m", "y", "r", "l", "ḷ", "v", "s", "h", "kk", "tt", "pp", "cc", "ññ",
+          "mm", "ll", "ss", "ṅk", "ṅg", "ñc", "ñj", "ṇḍ", "nt", "nd", "mp", "mb", "br", "tv", "dv", "sv", "ty",
+          "vy", "my", "ly", "hm", "ṇh", "nh", "mh", "ḷh", "sm", "sn", "kl", "gr")
+VOWELS = ("a", "a", "a", "ā", "i", "ī", "u", "ū", "e", "o")
+CODAS = ("", "", "", "", "ṃ", "ṁ", "ṃ")
+SEPARATORS = (" ", " ", " ", " ", ", ", ". ", "; ", ": ", "? ", "! ", " — ", " – ", "-", " - ", "'", "’", " …",
+              " … ", "…. ", "\n", "\n", "\n\n", "  ", " \n")
+QUOTES = ("“", "”", "‘", "’", "\"", "'")
+EXTRAS = ("pts1ed", "Variant:", "bj,", "sya-all", "sya-all,", " km", "1.", "12.", "3. ", "¶", "(", ")", "[", "]",
+          "gaṃgā", "saṃyoga", "ṅ", "ññ", "vv", "w", "W", "V", "â", "Ô", "Α", "Β", "―", "•", "|", "\t")
+
+
+class Case(NamedTuple):
+    text: str
+    options: SplitOptions
+
+
+def known_deviation(text: str, options: SplitOptions) -> Optional[str]:
+    for description, applies in KNOWN_DEVIATIONS:
+        if applies(text, options):
+            return description
+    return None
+
+
+def outputs(text: str, options: SplitOptions, candidate: Splitter):
+    """What the reference and the candidate give, or the exceptions they raise."""
+    results = []
+    for splitter in (legacy_split, candidate):
+        try:
+            results.append(splitter(text, options))
+        except Exception as e:  # a crash is a mismatch like any other
+            results.append(f"<{type(e).__name__}: {e}>")
+    return results
+
+
+def differs(text: str, options: SplitOptions, candidate: Splitter) -> bool:
+    if known_deviation(text, options):
+        return False
+    expected, got = outputs(text, options, candidate)
+    return expected != got
+
+
+def random_word(rng: random.Random) -> str:
+    word = "".join(rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(rng.randint(1, 5)))
+    style = rng.random()
+    if style < 0.15:
+        return word.capitalize()
+    if style < 0.2:
+        return word.upper()
+    if style < 0.25:
+        return rng.choice(QUOTES) + word + rng.choice(QUOTES)
+    return word
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    """A Pāḷi-like text of about ``words`` words."""
+    parts = []
+    for _ in range(words):
+        pick = rng.random()
+        if pick < 0.05:
+            parts.append(rng.choice(EXTRAS))
+        elif pick < 0.07:
+            parts.append(str(rng.randint(0, 200)) + rng.choice((".", "", " ")))
+        elif pick < 0.09:
+            low, high = rng.choice(((0x20, 0x7e), (0xa0, 0x24f), (0x1e00, 0x1eff)))
+            parts.append(chr(rng.randint(low, high)))
+        else:
+            parts.append(random_word(rng))
+        parts.append(rng.choice(SEPARATORS))
+    text = "".join(parts)
+    return text.rstrip() if rng.random() < 0.7 else text
+
+
+def random_options(rng: random.Random) -> SplitOptions:
+    values = {name: rng.choice(values) for name, values in CHOICES.items()}
+    values["juncture_sign"] = rng.choice(SIGNS)
+    return SplitOptions(**values)
+
+
+def _reduce(units: List[str], fails: Callable[[str], bool]) -> List[str]:
+    """Delta debugging: drop ever smaller runs of ``units`` while the text still fails."""
+    chunks = 2
+    while len(units) > 1:
+        size = -(-len(units) // chunks)
+        for start in range(0, len(units), size):
+            trial = units[:start] + units[start + size:]
+            if fails("".join(trial)):
+                units = trial
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if chunks >= len(units):
+                break
+            chunks = min(chunks * 2, len(units))
+    return units
+
+
+def shrink(case: Case, candidate: Splitter) -> Case:
+    """The smallest text and the simplest options on which the candidate still differs."""
+    options = case.options
+    text = case.text
+    default = SplitOptions()
+    for field in fields(SplitOptions):
+        simpler = replace(options, **{field.name: getattr(default, field.name)})
+        if simpler != options and differs(text, simpler, candidate):
+            options = simpler
+
+    def fails(trial: str) -> bool:
+        return differs(trial, options, candidate)
+
+    if fails(""):
+        return Case("", options)
+    for pattern in (r"[^\n]*\n|[^\n]+", r"\s+|[^\s]+", r"(?s)."):
+        text = "".join(_reduce(re.findall(pattern, text), fails))
+    # Simpler options may only fail on the smaller text now
+    for field in fields(SplitOptions):
+        simpler = replace(options, **{field.name: getattr(default, field.name)})
+        if simpler != options and differs(text, simpler, candidate):
+            options = simpler
+    return Case(text, options)
+
+
+def describe(case: Case, candidate: Splitter) -> str:
+    default = SplitOptions()
+    changed = ", ".join(f"{field.name}={getattr(case.options, field.name)!r}" for field in fields(SplitOptions)
+                        if getattr(case.options, field.name) != getattr(default, field.name))
+    expected, got = outputs(case.text, case.options, candidate)
+    at = next((i for i, (a, b) in enumerate(zip(expected, got)) if a != b), min(len(expected), len(got)))
+    return (f"  text:     {case.text!r}\n"
+            f"  options:  SplitOptions({changed})\n"
+            f"  expected: {expected!r}\n"
+            f"  got:      {got!r}\n"
+            f"  first difference at character {at}")
+
+
+def load_candidate(name: str) -> Splitter:
+    if name in CANDIDATES:
+        return CANDIDATES[name]
+    module, _, function = name.partition(":")
+    if not function:
+        raise ValueError(f"unknown candidate {name!r}: give one of {', '.join(CANDIDATES)} or module:function")
+    return getattr(importlib.import_module(module), function)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidate", default="split_text",
+                        help=f"{', '.join(CANDIDATES)} or module:function (default split_text)")
+    parser.add_argument("--quick", action="store_true",
+                        help="one option at a time on the fixtures instead of every combination")
+    parser.add_argument("--fixtures", nargs="*", choices=FIXTURES, default=list(FIXTURES))
+    parser.add_argument("--cases", type=int, default=2000, help="random texts (default 2000)")
+    parser.add_argument("--words", type=int, default=60, help="most words in a random text (default 60)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-failures", type=int, default=5,
+                        help="stop after shrinking this many mismatches (default 5)")
+    args = parser.parse_args(argv)
+    try:
+        candidate = load_candidate(args.candidate)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+
+    combinations = one_at_a_time() if args.quick else all_combinations()
+    rng = random.Random(args.seed)
+
+    def cases():
+        for name, text in load_fixtures(args.fixtures).items():
+            print(f"{name}: {len(text):,} characters, {len(combinations):,} combinations", file=sys.stderr)
+            for options in combinations:
+                yield name, Case(text, options)
+        print(f"random: {args.cases:,} texts (seed {args.seed})", file=sys.stderr)
+        for _ in range(args.cases):
+            yield "random", Case(random_text(rng, rng.randint(0, args.words)), random_options(rng))
+
+    start = time.perf_counter()
+    checked = mismatched = 0
+    skipped = Counter()
+    failures = []
+    seen = set()
+    for source, case in cases():
+        deviation = known_deviation(*case)
+        if deviation:
+            skipped[deviation] += 1
+            continue
+        checked += 1
+        if not differs(case.text, case.options, candidate):
+            continue
+        mismatched += 1
+        smallest = shrink(case, candidate)
+        if smallest in seen:
+            continue
+        seen.add(smallest)
+        failures.append((source, smallest))
+        print(f"MISMATCH ({source}):\n{describe(smallest, candidate)}")
+        if len(failures) >= args.max_failures:
+            print(f"stopping after {len(failures)} mismatches")
+            break
+
+    print(f"{checked:,} cases checked against the original chain in {time.perf_counter() - start:.0f} s, "
+          f"{sum(skipped.values()):,} skipped as known deviations, {mismatched:,} mismatches "
+          f"({len(failures)} distinct after shrinking)")
+    for description, count in skipped.most_common():
+        print(f"  {count:,} skipped: {description}")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Benchmark every sidebar option combination on the bundled fixtures.
+
+The fixtures in ``benchmarks/fixtures`` grow in size: the Ratana Sutta
+stanza shown on the page, the essential chants of the Bhikkhu Manual and
+the Dhammacakkappavattana Sutta as a long prose text (all of them
+canonical Pāḷi, in the public domain). Each is split with every option
+combination the sidebar allows (12,288 of them, a few minutes in all;
+``--quick`` takes one option at a time instead), with the default
+juncture sign and with "-" (which meets "hide hyphens"), after compiling
+the plan and a warm-up split outside the timings. For each fixture the
+report gives the throughput, the p50 and p95 latency over all
+combinations, the peak memory (with tracemalloc, over the
+one-option-at-a-time combinations) and the median latency with each
+option value, so a regression points to the option behind it.
+
+    python benchmarks/suite.py [--quick] [--repeat N] [--save benchmarks/baseline.json]
+    python benchmarks/suite.py --compare benchmarks/baseline.json
+
+``--save`` writes the results as JSON, rounded so that a rerun on the
+same machine changes few lines; commit it as the baseline and a later
+revision's ``--save`` shows regressions as a diff. ``--compare`` prints
+the change against a saved baseline and fails if any fixture is more
+than ``--tolerance`` slower.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, replace
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from palijuncture import SplitOptions, split_text  # noqa: E402
+from palijuncture.engine import compile_plan  # noqa: E402
+from palijuncture.options import DEFAULT_JUNCTURE_SIGN, NIGGAHITA, TRANSLITERATIONS, V_W  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = ("ratana_stanza", "essential_chants", "dhammacakkappavattana_sutta")
+
+# Every value the sidebar offers for each option
+CHOICES = {
+    "juncture_sign": (DEFAULT_JUNCTURE_SIGN, "-"),
+    "show_punctuation": (False, True),
+    "hide_hyphens": (False, True),
+    "uppercase": (False, True),
+    "samyoga_pauses": (False, True),
+    "transliteration": tuple(TRANSLITERATIONS.values()),
+    "nasal_nn": (False, True),
+    "nasal_ng": (False, True),
+    "niggahita": tuple(NIGGAHITA.values()),
+    "v_w": tuple(V_W.values()),
+    "medial_nasal": (False, True),
+}
+assert set(CHOICES) == {field.name for field in fields(SplitOptions)}, "an option is missing from CHOICES"
+
+
+def all_combinations() -> List[SplitOptions]:
+    """Every combination, the juncture sign changing fastest (it shares the compiled plan)."""
+    names = list(CHOICES)
+    return [SplitOptions(**dict(zip(names, values))) for values in itertools.product(*CHOICES.values())]
+
+
+def one_at_a_time() -> List[SplitOptions]:
+    """The defaults, then each other value of each option on its own."""
+    base = SplitOptions()
+    combinations = [base]
+    for name, values in CHOICES.items():
+        combinations.extend(replace(base, **{name: value}) for value in values if value != getattr(base, name))
+    return combinations
+
+
+def label(name: str, value) -> str:
+    return f"{name}={value}"
+
+
+def load_fixtures(names=FIXTURES) -> Dict[str, str]:
+    texts = {}
+    for name in names:
+        with open(os.path.join(FIXTURES_DIR, name + ".txt"), encoding="utf-8") as f:
+            texts[name] = f.read()
+    return texts
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def peak_bytes(text: str, combinations: List[SplitOptions]) -> int:
+    peak = 0
+    for options in combinations:
+        compile_plan(options)
+        tracemalloc.start()
+        try:
+            split_text(text, options)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return peak
+
+
+def run_fixture(text: str, combinations: List[SplitOptions], repeat: int) -> Dict:
+    latencies = []
+    by_value: Dict[str, List[float]] = {}
+    for number, options in enumerate(combinations):
+        compile_plan(options)
+        split_text(text, options)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            split_text(text, options)
+            times.append((time.perf_counter() - start) * 1000)
+        latencies.extend(times)
+        best = min(times)
+        for name in CHOICES:
+            by_value.setdefault(label(name, getattr(options, name)), []).append(best)
+        if number % 500 == 499:
+            print(f"  {number + 1:,}/{len(combinations):,} combinations", file=sys.stderr)
+    ordered = sorted(latencies)
+    total_ms = sum(latencies)
+    return {
+        "chars": len(text),
+        "lines": text.count("\n") + 1,
+        "splits": len(latencies),
+        "chars_per_s": _round(len(text) * len(latencies) / (total_ms / 1000)),
+        "p50_ms": _round(percentile(ordered, 50)),
+        "p95_ms": _round(percentile(ordered, 95)),
+        "peak_kb": _round(peak_bytes(text, one_at_a_time()) / 1024),
+        "options": {key: _round(statistics.median(values)) for key, values in by_value.items()},
+    }
+
+
+def _round(value: float) -> float:
+    """Three significant digits, so reruns do not change every line of the baseline."""
+    return float(f"{value:.3g}")
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> bool:
+    ok = True
+    for name, result in results["fixtures"].items():
+        old = baseline.get("fixtures", {}).get(name)
+        if old is None:
+            print(f"{name}: not in the baseline")
+            continue
+        changes = []
+        for key in ("chars_per_s", "p50_ms", "p95_ms", "peak_kb"):
+            if old.get(key):
+                changes.append(f"{key} {result[key] / old[key] - 1:+.0%}")
+        slower = result["p50_ms"] / old["p50_ms"] - 1 if old.get("p50_ms") else 0.0
+        flag = "  SLOWER" if slower > tolerance else ""
+        ok = ok and not flag
+        print(f"{name}: {', '.join(changes)}{flag}")
+        worst = sorted(((value / old["options"][key] - 1, key) for key, value in result["options"].items()
+                        if old.get("options", {}).get(key)), reverse=True)[:3]
+        print("  most changed options: " + ", ".join(f"{key} {change:+.0%}" for change, key in worst))
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true",
+                        help="one option at a time instead of every combination")
+    parser.add_argument("--repeat", type=int, default=1, help="timed splits per combination (default 1)")
+    parser.add_argument("--fixtures", nargs="+", choices=FIXTURES, default=list(FIXTURES))
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare with a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="p50 slowdown that fails --compare (default 0.25)")
+    args = parser.parse_args(argv)
+
+    combinations = one_at_a_time() if args.quick else all_combinations()
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "combinations": len(combinations),
+        "repeat": args.repeat,
+        "fixtures": {},
+    }
+    for name, text in load_fixtures(args.fixtures).items():
+        print(f"{name}: {len(text):,} characters, {len(combinations):,} combinations", file=sys.stderr)
+        result = results["fixtures"][name] = run_fixture(text, combinations, args.repeat)
+        print(f"{name:30} {result['chars']:7,} chars  {result['chars_per_s']:12,.0f} chars/s  "
+              f"p50 {result['p50_ms']:8.3f} ms  p95 {result['p95_ms']:8.3f} ms  peak {result['peak_kb']:8.1f} KB")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("combinations") != results["combinations"]:
+            print(f"note: the baseline has {baseline.get('combinations')} combinations, this run "
+                  f"{results['combinations']}")
+        return 0 if compare(results, baseline, args.tolerance) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Peak memory and speed of splitting uploaded files, for each source type.
+
+Builds a text, XML (UTF-16, as the VRI files are) and JSON file of the
+given size in memory, as Streamlit holds an upload, and splits each with
+:class:`palijuncture.upload.UploadSplit`. Memory is traced (without a
+line memo) from after the upload is in memory, so it is what splitting
+adds: text and XML should stay under a fixed bound whatever the size,
+JSON under a multiple of it. Also checks the split text against
+``split_text`` and that files over the limits are refused.
+
+    python benchmarks/upload.py [megabytes]
+"""
+
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from line_memo import CHANTS  # noqa: E402
+from palijuncture import LineMemo, split_text  # noqa: E402
+from palijuncture.upload import MAX_JSON_MB, MAX_UPLOAD_MB, UploadSplit, check_upload  # noqa: E402
+
+# Peak added by splitting a text or XML file, whatever its size
+MAX_STREAMING_MB = 8
+# Peak added by splitting a JSON file, as a multiple of its size
+MAX_JSON_RATIO = 12
+
+
+def sources(megabytes: float):
+    paragraphs = [p for p in CHANTS.split("\n\n") if p.strip()]
+    count = max(1, int(megabytes * 2 ** 20 / len(CHANTS.encode("utf-8"))) * len(paragraphs))
+    text = "\n\n".join(f"{paragraphs[i % len(paragraphs)]} {i}" for i in range(count))
+    yield "sutta.txt", text.encode("utf-8"), text
+    xml = "".join(f"<p rend=\"bodytext\">{' '.join(p.split())}</p>\n" for p in text.split("\n\n"))
+    xml = f'<?xml version="1.0" encoding="UTF-16"?>\n<body>\n{xml}</body>\n'
+    yield "sutta.xml", xml.encode("utf-16"), "".join(" ".join(p.split()) + "\n" for p in text.split("\n\n"))
+    segments = {f"dn1:{i}": " ".join(p.split()) for i, p in enumerate(text.split("\n\n"))}
+    yield "sutta.json", json.dumps(segments, ensure_ascii=False).encode("utf-8"), "".join(
+        s + "\n" for s in segments.values())
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    megabytes = float(argv[0]) if argv else 2
+    ok = True
+    for name, data, text in sources(megabytes):
+        start = time.perf_counter()
+        job = UploadSplit(io.BytesIO(data), name, len(data), memo=LineMemo())
+        job.wait()
+        elapsed = time.perf_counter() - start
+        with job.open() as f:
+            same = "".join(f) == split_text(text)
+        job.remove()
+
+        # Without a line memo, which is bounded on its own (see benchmarks/line_memo.py)
+        tracemalloc.start()
+        try:
+            traced = UploadSplit(io.BytesIO(data), name, len(data))
+            traced.wait()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        traced.remove()
+        if name.endswith(".json"):
+            limit = MAX_JSON_RATIO * len(data)
+        else:
+            limit = MAX_STREAMING_MB * 2 ** 20
+        ok = ok and job.error is None and same and peak <= limit
+        print(f"{name}: {len(data) / 2 ** 20:6.1f} MB, {job.lines:,} lines in {elapsed:5.2f} s "
+              f"({len(data) / 2 ** 20 / elapsed:5.1f} MB/s), peak {peak / 2 ** 20:6.1f} MB "
+              f"(limit {limit / 2 ** 20:.0f} MB), {'same as' if same else 'DIFFERS FROM'} split_text"
+              + (f", error: {job.error}" if job.error else ""))
+
+    for name, limit in (("big.txt", MAX_UPLOAD_MB), ("big.json", MAX_JSON_MB)):
+        try:
+            check_upload(name, limit * 2 ** 20 + 1)
+            print(f"{name} over {limit} MB was NOT refused")
+            ok = False
+        except ValueError as e:
+            print(f"refused: {e}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
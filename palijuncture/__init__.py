@@ -0,0 +1,15 @@
+"""Pāḷi text juncture splitter, without the Streamlit page.
+
+Importing this package only needs the standard library, so batch jobs and
+scripts can use it without Streamlit, altair or pandas installed. The
+rules are compiled on the first split, not at import time.
+"""
+
+from .cache import SplitCache
+from .engine import split_text
+from .memo import LineMemo
+from .options import SplitOptions
+from .store import SplitStore
+from .stream import split_lines
+
+__all__ = ["LineMemo", "SplitCache", "SplitOptions", "SplitStore", "split_lines", "split_text"]
@@ -0,0 +1,7 @@
+"""``python -m palijuncture``: split text files, see :mod:`palijuncture.batch`."""
+
+import sys
+
+from .batch import main
+
+sys.exit(main())
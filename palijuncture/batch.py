@@ -0,0 +1,184 @@
+"""Split text files from the command line.
+
+Takes files, glob patterns and directories, and writes the split text of
+each file either next to it (``sutta.txt`` → ``sutta.split.txt``) or,
+with ``--output``, into a tree of the same shape under another directory::
+
+    python -m palijuncture chants/ "suttas/**/*.txt" --output split/ --jobs 4
+
+``--format`` writes Markdown, HTML, ODT or EPUB instead of plain text,
+with the file extension to match. Files are read and written line by line, so their size does not matter.
+With more than one job they are spread over a pool of processes, each
+with its own line memo.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .export import FORMATS, export
+from .memo import LineMemo
+from .options import SplitOptions, add_option_arguments, options_from_arguments
+from .stream import split_lines
+
+DEFAULT_SUFFIX = ".split"
+DEFAULT_PATTERN = "*.txt"
+
+# One per process, so refrains repeated across files are split once
+_memo: Optional[LineMemo] = None
+
+
+def find_inputs(paths: Iterable[str], pattern: str = DEFAULT_PATTERN,
+                suffix: str = DEFAULT_SUFFIX) -> Iterator[Tuple[str, str]]:
+    """Every input file with the path it has under the output tree.
+
+    Directories are searched recursively for ``pattern``. Files that look
+    like earlier output (their name ends with ``suffix``) are skipped,
+    unless they are named on their own.
+    """
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            found = glob.glob(os.path.join(glob.escape(path), "**", pattern), recursive=True)
+            found = [(name, os.path.relpath(name, path)) for name in sorted(found)]
+        elif os.path.isfile(path):
+            found = [(path, os.path.basename(path))]
+        else:
+            found = [(name, name) for name in sorted(glob.glob(path, recursive=True)) if os.path.isfile(name)]
+            if not found:
+                raise FileNotFoundError(f"no such file or directory: {path}")
+        for name, relative in found:
+            if path != name and os.path.splitext(name)[0].endswith(suffix):
+                continue
+            if os.path.abspath(name) not in seen:
+                seen.add(os.path.abspath(name))
+                yield name, relative
+
+
+def output_path(path: str, relative: str, output: Optional[str], suffix: str = DEFAULT_SUFFIX,
+                extension: Optional[str] = None) -> str:
+    """Where the split text of ``path`` goes, with ``extension`` instead of its own if given."""
+    if output is None:
+        stem, own_extension = os.path.splitext(path)
+        return stem + suffix + (extension or own_extension)
+    relative = os.path.normpath(relative).lstrip(os.sep)
+    while relative.startswith(os.pardir + os.sep):
+        relative = relative[len(os.pardir + os.sep):]
+    if extension:
+        relative = os.path.splitext(relative)[0] + extension
+    return os.path.join(output, relative)
+
+
+def split_file(source: str, target: str, options: SplitOptions, fmt: str = "txt") -> int:
+    """Split ``source`` into ``target`` as ``fmt``; returns the number of characters read."""
+    global _memo
+    if os.path.realpath(target) == os.path.realpath(source) or (
+            os.path.exists(target) and os.path.samefile(target, source)):
+        # Opening the target for writing would empty the source before it is read
+        raise ValueError(f"the output would overwrite the input: {target}")
+    if _memo is None:
+        _memo = LineMemo()
+    chars = 0
+
+    def lines(f):
+        nonlocal chars
+        for line in f:
+            chars += len(line)
+            yield line
+
+    directory = os.path.dirname(target)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    title = os.path.splitext(os.path.basename(source))[0]
+    with open(source, encoding="utf-8") as f:
+        out = open(target, "wb")
+        try:
+            with out:
+                export(split_lines(lines(f), options, _memo), out, fmt, title)
+        except BaseException:
+            # No half-written file is left behind (e.g. the input is not UTF-8)
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+            raise
+    return chars
+
+
+def _split_file(job) -> Tuple[int, Optional[str]]:
+    """``split_file`` on one job: (characters, None), or (0, what went wrong)."""
+    try:
+        return split_file(*job), None
+    except UnicodeDecodeError as e:
+        return 0, f"not UTF-8 text ({e.reason} at byte {e.start})"
+    except OSError as e:
+        return 0, f"{e.strerror}: {e.filename}" if e.strerror and e.filename else str(e)
+    except ValueError as e:
+        return 0, str(e)
+
+
+def split_files(jobs: List[Tuple[str, str, SplitOptions, str]],
+                workers: int = 1) -> Iterator[Tuple[str, int, Optional[str]]]:
+    """Run ``split_file`` on every (source, target, options, format).
+
+    Yields (source, characters, error) for each; a file that cannot be
+    read or written gets the error and no output, and the others go on.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield (job[0],) + _split_file(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for job, result in zip(jobs, pool.map(_split_file, jobs)):
+            yield (job[0],) + result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture", description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="file, directory or glob pattern")
+    parser.add_argument("-o", "--output", metavar="DIR",
+                        help="write into this directory instead of next to each file")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN,
+                        help=f"files to take from directories (default {DEFAULT_PATTERN})")
+    parser.add_argument("--suffix", default=DEFAULT_SUFFIX,
+                        help=f"added to the name of files written next to their input (default {DEFAULT_SUFFIX})")
+    parser.add_argument("-f", "--format", choices=list(FORMATS), default="txt",
+                        help="write plain text (the default), Markdown, HTML, ODT or EPUB")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only report the total")
+    add_option_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        options = options_from_arguments(args)
+        inputs = list(find_inputs(args.paths, args.pattern, args.suffix))
+    except (ValueError, FileNotFoundError) as e:
+        parser.error(str(e))
+    extension = FORMATS[args.format][0] if args.format != "txt" else None
+    jobs = [(path, output_path(path, relative, args.output, args.suffix, extension), options, args.format)
+            for path, relative in inputs]
+
+    start = time.perf_counter()
+    total = 0
+    failed = 0
+    for path, chars, error in split_files(jobs, args.jobs):
+        total += chars
+        if error:
+            failed += 1
+            print(f"{path}: skipped, {error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"{path}: {chars:,} characters", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed else 0.0
+    print(f"{len(jobs) - failed} files, {total:,} characters in {elapsed:.2f} s ({rate:,.0f} chars/s)"
+          + (f"; {failed} failed" if failed else ""), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Group split lines into a few markdown blocks for the page.
+
+Every ``st.write`` is a message to the browser. One message per line
+floods it, and one message for the whole text keeps the page blank until
+all of it is split and sent. :func:`markdown_blocks` takes the lines as
+they come and gives blocks that start small, so the first lines show at
+once, and double in size up to ``most`` lines. Blocks end at blank lines
+(between paragraphs or stanzas) where there are any, so they look the same
+as the text written at once.
+"""
+
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+FIRST_BLOCK_LINES = 16
+MAX_BLOCK_LINES = 1024
+
+
+def markdown_blocks(lines: Iterable[str], first: int = FIRST_BLOCK_LINES, most: int = MAX_BLOCK_LINES,
+                    can_end: Optional[Callable[[str], bool]] = None) -> Iterator[str]:
+    """The ``lines`` joined into blocks of ``first``, then twice as many, ... up to ``most`` lines.
+
+    A block is only ended after a line for which ``can_end`` is true (by
+    default, a blank line), unless it has reached ``most`` lines.
+    """
+    if can_end is None:
+        def can_end(line):
+            return not line.strip()
+    size = first
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= most or (len(block) >= size and can_end(line)):
+            yield "".join(block)
+            block = []
+            size = min(size * 2, most)
+    if block:
+        yield "".join(block)
+
+
+def line_by_line(text: str, split_lines: Iterable[str]) -> Iterator[str]:
+    """Each input line followed by its split line, as paragraphs."""
+    for line, split in zip(text.split("\n"), split_lines):
+        yield line + "\n\n" + (split[:-1] if split.endswith("\n") else split) + "\n\n"
+
+
+class FirstLineTimer:
+    """Time from the start of a run to the first block on the page."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_ms: Optional[float] = None
+        self.total_ms: Optional[float] = None
+
+    def blocks(self, blocks: Iterable[str]) -> Iterator[str]:
+        """Pass ``blocks`` through, noting when the first one and the last one are out."""
+        for block in blocks:
+            yield block
+            if self.first_ms is None:
+                self.first_ms = (time.perf_counter() - self.started) * 1000
+        self.total_ms = (time.perf_counter() - self.started) * 1000
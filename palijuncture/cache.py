@@ -0,0 +1,101 @@
+"""A process-wide cache of split texts.
+
+The Streamlit page reruns from the top on every widget change, and many
+visitors paste the same chants. The expensive core split is kept in a
+size-capped LRU cache keyed by a hash of the text and the few options the
+core depends on. The output stages (transliteration, nasals, v/w,
+punctuation, the juncture sign) are cheap and run on every lookup, so
+toggling them never misses the cache.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .engine import core_options, finish_split, render, split_core
+from .memo import LineMemo
+from .options import SplitOptions
+
+DEFAULT_MAX_BYTES = 64 * 2 ** 20
+
+
+def cache_key(text: str, options: SplitOptions):
+    """The key a split is cached under."""
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return digest, core_options(options)
+
+
+class SplitCache:
+    """LRU cache of core splits holding at most ``max_bytes`` of them.
+
+    Safe to share between threads, as Streamlit sessions do. Texts that
+    miss go through ``lines`` if given, so repeated lines are only split
+    once even inside new texts.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, lines: Optional[LineMemo] = None):
+        self.max_bytes = max_bytes
+        self.lines = lines
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def split(self, text: str, options: Optional[SplitOptions] = None,
+              core_split: Optional[Callable[[str, SplitOptions], str]] = None) -> str:
+        """Like :func:`palijuncture.split_text`, but cached.
+
+        ``core_split`` replaces :func:`palijuncture.engine.split_core` on a
+        miss, e.g. to do it in another process.
+        """
+        if options is None:
+            options = SplitOptions()
+        key = cache_key(text, options)
+        with self._lock:
+            core = self._entries.get(key)
+            if core is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if core is None:
+            if core_split is None:
+                core_split = self.lines.split_core if self.lines else split_core
+            core = core_split(text, options)
+            self._store(key, core)
+        return render(finish_split(core, text, options), options)
+
+    def _store(self, key, core: str):
+        size = sys.getsizeof(core)
+        with self._lock:
+            if size > self.max_bytes or key in self._entries:
+                return
+            self._entries[key] = core
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for the debug panel."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,267 @@
+"""How often each rule matched, and what it cost, over a corpus.
+
+Of the 2,700-odd rules many may never match real text. :class:`RuleCoverage`
+splits texts one rule at a time, as the original replace chain did, and
+records for each rule how many replacements it made and how long its
+``str.replace`` took (the fastest of a few timings). Rules whose stage was
+never run with the options used are told apart from rules that ran and
+never matched, so the report shows which rules could be dropped or merged
+and what keeping them costs. A rule that never matched one corpus may
+still match another text; ``benchmarks/oracle.py`` shows whether dropping
+it changes any output.
+
+    coverage = RuleCoverage()
+    for text in corpus:
+        coverage.split(text)
+    print(coverage.table(top=50))
+
+Going one rule at a time gives the same text as :func:`split_text` but
+is much slower, so this is for analysis only. The engine merges most
+rules into regular expressions (the ``step`` of each rule in the report),
+where a rule that never matches costs little more than its branch of the
+pattern; a rule alone in a ``replace`` step costs a pass over the text.
+From the command line, with every option set in turn::
+
+    python -m palijuncture.coverage sutta.txt chants.txt --every-option --json rules.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import fields, replace
+from typing import Dict, List, Optional, Tuple
+
+from .engine import Step, compile_plan, render, run_step
+from .options import NIGGAHITA, TRANSLITERATIONS, V_W, SplitOptions, add_option_arguments, options_from_arguments
+from .rules import CORE_STAGES, END_OF_TEXT, FIRST_LETTERS, OUTPUT_STAGES, JUNCTURE
+
+SORT_KEYS = ("hits", "cost")
+
+
+def every_option() -> List[SplitOptions]:
+    """Each value of each option on its own and with UPPERCASE, so that every stage runs."""
+    choices = {
+        "transliteration": TRANSLITERATIONS.values(),
+        "niggahita": NIGGAHITA.values(),
+        "v_w": V_W.values(),
+    }
+    base = SplitOptions()
+    sets = [base]
+    for field in fields(SplitOptions):
+        if field.name == "juncture_sign":
+            continue  # only render() sees it
+        for value in choices.get(field.name, (False, True)):
+            if value != getattr(base, field.name):
+                sets.append(replace(base, **{field.name: value}))
+    # The uppercase variants of some stages only run with UPPERCASE on
+    upper = [replace(options, uppercase=True) for options in sets if not options.uppercase]
+    return sets + [options for options in upper if options not in sets]
+
+
+class RuleStats:
+    """What one rule did over every text split so far."""
+
+    __slots__ = ("stage", "index", "old", "new", "step", "runs", "hits", "seconds")
+
+    def __init__(self, stage: str, index: int, old: str, new: str):
+        self.stage = stage
+        self.index = index
+        self.old = old
+        self.new = new
+        # The kind of engine step the rule is compiled into ("" if never run)
+        self.step = ""
+        self.runs = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "stage": self.stage,
+            "index": self.index,
+            "old": _show(self.old),
+            "new": _show(self.new),
+            "step": self.step,
+            "runs": self.runs,
+            "hits": self.hits,
+            "ms": round(self.seconds * 1000, 3),
+        }
+
+
+def _show(text: str) -> str:
+    """A rule as it reads in rules.py, with J for the juncture sign."""
+    return text.replace(" " + JUNCTURE + " ", "+J+").replace(JUNCTURE, "J")
+
+
+class RuleCoverage:
+    """Replacements made and time taken per rule, in the order of :data:`palijuncture.rules.STAGES`.
+
+    A rule with ``old == new`` is dropped when the plan is compiled and
+    never run; the special steps (the first letters rejoined, the double
+    sign at the end) count as one rule each, hit when they change the
+    text.
+    """
+
+    def __init__(self, repeat: int = 3):
+        # Each replacement is timed this many times and the fastest kept
+        self.repeat = repeat
+        self.rules: Dict[Tuple[str, int], RuleStats] = {}
+        for stage in CORE_STAGES + OUTPUT_STAGES:
+            if stage in (FIRST_LETTERS, END_OF_TEXT):
+                self.rules[stage, 0] = RuleStats(stage, 0, f"<{stage}>", "")
+                continue
+            for index, (old, new) in enumerate(stage.rules):
+                self.rules[stage.name, index] = RuleStats(stage.name, index, old, new)
+        self.texts = 0
+        self.characters = 0
+
+    def split(self, text: str, options: Optional[SplitOptions] = None) -> str:
+        """Split ``text`` as :func:`palijuncture.split_text` does, counting every rule."""
+        if options is None:
+            options = SplitOptions()
+        # The plan keeps the rules in order, leaving out the same ones as below
+        kinds = iter([step.kind for step in compile_plan(options) for _ in step.rules])
+        result = text
+        for stage in CORE_STAGES + OUTPUT_STAGES:
+            if stage in (FIRST_LETTERS, END_OF_TEXT):
+                stats = self.rules[stage, 0]
+                stats.step = stage
+                stats.runs += 1
+                step = Step(stage, (), stage)
+                stats.seconds += self._time(run_step, step, result, text)
+                changed = run_step(step, result, text)
+                stats.hits += changed != result
+                result = changed
+                continue
+            if stage.when is not None and not stage.when(options):
+                continue
+            for index, (old, new) in enumerate(stage.rules):
+                if old == new:
+                    continue
+                stats = self.rules[stage.name, index]
+                stats.step = next(kinds)
+                stats.runs += 1
+                stats.hits += result.count(old)
+                stats.seconds += self._time(result.replace, old, new)
+                result = result.replace(old, new)
+        result = render(result, options)
+        self.texts += 1
+        self.characters += len(text)
+        return result
+
+    def _time(self, function, *args) -> float:
+        best = float("inf")
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            function(*args)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def reset(self):
+        for stats in self.rules.values():
+            stats.step = ""
+            stats.runs = stats.hits = 0
+            stats.seconds = 0.0
+        self.texts = self.characters = 0
+
+    def ranked(self, by: str = "hits") -> List[RuleStats]:
+        """The rules that ran, fewest hits (then most time) first, or most time first."""
+        ran = [stats for stats in self.rules.values() if stats.runs]
+        if by == "cost":
+            return sorted(ran, key=lambda stats: (-stats.seconds, stats.hits))
+        if by == "hits":
+            return sorted(ran, key=lambda stats: (stats.hits, -stats.seconds))
+        raise ValueError(f"unknown sort key: {by!r}")
+
+    def never_run(self) -> List[RuleStats]:
+        """Rules in stages that the options used never turned on."""
+        return [stats for stats in self.rules.values() if not stats.runs and stats.old != stats.new]
+
+    def summary(self) -> Dict:
+        ran = [stats for stats in self.rules.values() if stats.runs]
+        dead = [stats for stats in ran if not stats.hits]
+        stages: Dict[str, Dict[str, int]] = {}
+        for stats in ran:
+            stage = stages.setdefault(stats.stage, {"rules": 0, "never_matched": 0})
+            stage["rules"] += 1
+            stage["never_matched"] += not stats.hits
+        return {
+            "texts": self.texts,
+            "characters": self.characters,
+            # The fastest of each rule's timings, added up
+            "ms": round(sum(stats.seconds for stats in self.rules.values()) * 1000, 3),
+            "rules": len(self.rules),
+            "ran": len(ran),
+            "never_matched": len(dead),
+            "never_matched_ms": round(sum(stats.seconds for stats in dead) * 1000, 3),
+            "never_run": len(self.never_run()),
+            "no_op": sum(stats.old == stats.new for stats in self.rules.values()),
+            "stages": stages,
+        }
+
+    def as_dict(self, by: str = "hits") -> Dict:
+        return {
+            "summary": self.summary(),
+            "rules": [stats.as_dict() for stats in self.ranked(by)],
+            "never_run": [stats.as_dict() for stats in self.never_run()],
+        }
+
+    def to_json(self, by: str = "hits", indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(by), ensure_ascii=False, indent=indent)
+
+    def table(self, top: Optional[int] = None, by: str = "hits") -> str:
+        """The rules that ran as a text table, in the order of :meth:`ranked`."""
+        rows = [f"{'stage':34} {'#':>4} {'step':13} {'hits':>9} {'ms':>9}  rule"]
+        for stats in self.ranked(by)[:top]:
+            rows.append(f"{stats.stage:34} {stats.index:4} {stats.step:13} {stats.hits:9,} "
+                        f"{stats.seconds * 1000:9.3f}  {_show(stats.old)!r} → {_show(stats.new)!r}")
+        return "\n".join(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture.coverage", description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="*", metavar="FILE", help="text to split (default: standard input)")
+    parser.add_argument("--every-option", action="store_true",
+                        help="split each text with every option value in turn, ignoring the option flags")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="hits",
+                        help="fewest hits first (default) or most time first")
+    parser.add_argument("--json", metavar="FILE", help="write every rule as JSON here ('-' for standard output)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="time each replacement this many times and keep the fastest (default 3)")
+    parser.add_argument("--top", type=int, default=None, help="only list this many rules")
+    add_option_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        option_sets = every_option() if args.every_option else [options_from_arguments(args)]
+    except ValueError as e:
+        parser.error(str(e))
+
+    texts = []
+    for path in args.paths or ["-"]:
+        if path == "-":
+            texts.append(sys.stdin.read())
+        else:
+            with open(path, encoding="utf-8") as f:
+                texts.append(f.read())
+    coverage = RuleCoverage(repeat=args.repeat)
+    for options in option_sets:
+        for text in texts:
+            coverage.split(text, options)
+
+    if args.json == "-":
+        print(coverage.to_json(args.sort))
+        return 0
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(coverage.to_json(args.sort) + "\n")
+    print(coverage.table(args.top, args.sort))
+    summary = coverage.summary()
+    print(f"{summary['ran']:,} of {summary['rules']:,} rules ran in {summary['texts']} splits of "
+          f"{summary['characters']:,} characters; {summary['never_matched']:,} never matched "
+          f"({summary['never_matched_ms']:.1f} ms), {summary['never_run']:,} never ran, "
+          f"{summary['no_op']} change nothing")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
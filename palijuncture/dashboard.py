@@ -0,0 +1,130 @@
+"""Charts for the performance dashboard, from the runs kept in :mod:`palijuncture.metrics`.
+
+Built with pandas, numpy and altair, which Streamlit already brings along.
+They are only imported here, and the page only imports this module when
+the dashboard is open, so ``import palijuncture`` stays light (see
+``benchmarks/import_time.py``).
+"""
+
+from typing import Dict, List
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+PERCENTILES = (50, 90, 95, 99)
+# Counters recorded per run -> the hit rate they make
+HIT_RATES = {
+    "split cache": ("cache_hits", "cache_misses"),
+    "line memo": ("memo_hits", "memo_misses"),
+    "session lines": ("lines_reused", "lines_resplit"),
+}
+
+
+def runs_frame(entries: List[Dict]) -> pd.DataFrame:
+    """One row per run: time, path, characters, lines, ms, first_ms."""
+    frame = pd.DataFrame(entries, columns=["time", "path", "chars", "lines", "ms", "first_ms"])
+    frame["time"] = pd.to_datetime(frame["time"], unit="s")
+    return frame
+
+
+def stages_frame(entries: List[Dict]) -> pd.DataFrame:
+    """One row per profiled run and stage: time, stage, ms."""
+    rows = [{"time": entry["time"], "stage": stage, "ms": ms}
+            for entry in entries if entry.get("stages") for stage, ms in entry["stages"].items()]
+    frame = pd.DataFrame(rows, columns=["time", "stage", "ms"])
+    frame["time"] = pd.to_datetime(frame["time"], unit="s")
+    return frame
+
+
+def hit_rates_frame(entries: List[Dict]) -> pd.DataFrame:
+    """The hit rate of each cache in each run that used it: time, cache, hit_rate."""
+    counters = pd.DataFrame([entry.get("counters") or {} for entry in entries])
+    times = pd.to_datetime([entry["time"] for entry in entries], unit="s")
+    frames = []
+    for cache, (hits, misses) in HIT_RATES.items():
+        if hits not in counters or misses not in counters:
+            continue
+        hit_counts = counters[hits].fillna(0).to_numpy(dtype=float)
+        lookups = hit_counts + counters[misses].fillna(0).to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.where(lookups > 0, hit_counts / lookups, np.nan)
+        frames.append(pd.DataFrame({"time": times, "cache": cache, "hit_rate": rate}))
+    if not frames:
+        return pd.DataFrame(columns=["time", "cache", "hit_rate"])
+    return pd.concat(frames, ignore_index=True).dropna()
+
+
+def latency_percentiles(runs: pd.DataFrame) -> pd.DataFrame:
+    """Latency percentiles of every path and of all runs: path, percentile, ms."""
+    rows = []
+    for path, group in [("all", runs)] + list(runs.groupby("path")):
+        if len(group):
+            values = np.percentile(group["ms"].to_numpy(dtype=float), PERCENTILES)
+            rows.extend({"path": path, "percentile": f"p{p}", "ms": value}
+                        for p, value in zip(PERCENTILES, values))
+    return pd.DataFrame(rows, columns=["path", "percentile", "ms"])
+
+
+def stage_latency_chart(stages: pd.DataFrame, top: int = 15) -> alt.Chart:
+    """Mean milliseconds per stage over the profiled runs, slowest first."""
+    means = stages.groupby("stage", as_index=False)["ms"].mean().nlargest(top, "ms")
+    return alt.Chart(means, title="Mean time per stage (profiled runs)").mark_bar().encode(
+        x=alt.X("ms:Q", title="ms"),
+        y=alt.Y("stage:N", sort="-x", title=None),
+        tooltip=["stage", alt.Tooltip("ms:Q", format=".3f")],
+    )
+
+
+def size_runtime_chart(runs: pd.DataFrame) -> alt.Chart:
+    """Characters against milliseconds, one point per run, with a linear fit."""
+    points = alt.Chart(runs, title="Input size against runtime").mark_circle(opacity=0.6).encode(
+        x=alt.X("chars:Q", title="characters", scale=alt.Scale(type="symlog")),
+        y=alt.Y("ms:Q", title="ms", scale=alt.Scale(type="symlog")),
+        color="path:N",
+        tooltip=["time:T", "path", "chars", "lines", alt.Tooltip("ms:Q", format=".1f")],
+    )
+    if len(runs) < 2 or runs["chars"].nunique() < 2:
+        return points
+    slope, intercept = np.polyfit(runs["chars"].to_numpy(dtype=float), runs["ms"].to_numpy(dtype=float), 1)
+    line = pd.DataFrame({"chars": np.linspace(runs["chars"].min(), runs["chars"].max(), 50)})
+    line["ms"] = np.maximum(slope * line["chars"] + intercept, 0)
+    fit = alt.Chart(line).mark_line(color="gray", strokeDash=[4, 4]).encode(x="chars:Q", y="ms:Q")
+    return points + fit
+
+
+def hit_rate_chart(rates: pd.DataFrame) -> alt.Chart:
+    """Hit rate of each cache over time."""
+    return alt.Chart(rates, title="Cache hit rates").mark_line(point=True).encode(
+        x=alt.X("time:T", title=None),
+        y=alt.Y("hit_rate:Q", title="hit rate", axis=alt.Axis(format="%"), scale=alt.Scale(domain=[0, 1])),
+        color="cache:N",
+        tooltip=["time:T", "cache", alt.Tooltip("hit_rate:Q", format=".0%")],
+    )
+
+
+def percentile_chart(percentiles: pd.DataFrame) -> alt.Chart:
+    """Latency percentiles for each path."""
+    return alt.Chart(percentiles, title="Latency percentiles").mark_line(point=True).encode(
+        x=alt.X("percentile:N", sort=[f"p{p}" for p in PERCENTILES], title=None),
+        y=alt.Y("ms:Q", title="ms"),
+        color="path:N",
+        tooltip=["path", "percentile", alt.Tooltip("ms:Q", format=".1f")],
+    )
+
+
+def charts(entries: List[Dict]) -> Dict[str, alt.Chart]:
+    """Every chart there is data for, by name."""
+    result = {}
+    if not entries:
+        return result
+    runs = runs_frame(entries)
+    stages = stages_frame(entries)
+    if len(stages):
+        result["stages"] = stage_latency_chart(stages)
+    result["size"] = size_runtime_chart(runs)
+    rates = hit_rates_frame(entries)
+    if len(rates):
+        result["hit_rates"] = hit_rate_chart(rates)
+    result["percentiles"] = percentile_chart(latency_percentiles(runs))
+    return result
@@ -0,0 +1,170 @@
+"""Send large texts to a process pool, so one big paste cannot stall a server.
+
+Streamlit runs every session's script on a thread of one process, and the
+core split holds the GIL while it runs. A whole Nikāya chapter pasted by
+one visitor would freeze the page for everyone else. :class:`SplitDispatcher`
+splits small texts in place as before, and sends texts of ``threshold``
+characters or more to a shared pool of worker processes, with:
+
+* admission control: at most ``max_pending`` large texts in the pool;
+  beyond that :class:`Busy` is raised at once instead of queueing;
+* a per-session limit of ``per_session`` large texts at a time;
+* cancelling superseded work: a new text from a session cancels that
+  session's texts still waiting in the pool. A text already being split
+  runs to the end (a worker cannot be interrupted) and lands in the cache;
+* recovery: if a worker dies (say it runs out of memory) its text gets
+  :class:`Busy` and the next large text starts a fresh pool.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import CancelledError, Future, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .cache import SplitCache
+from .engine import core_options, split_core
+from .options import SplitOptions
+from .pool import core_split, piece_cores, start_pool
+
+# Texts shorter than this are split on the calling thread
+LARGE_TEXT = 100_000
+# How often a waiting caller gets control back, in seconds
+POLL_INTERVAL = 0.1
+
+
+class Busy(RuntimeError):
+    """The pool cannot split a large text just now: it is full, or the text was replaced or lost."""
+
+
+class SplitDispatcher:
+    """Splits through ``cache``, in worker processes for large texts. Safe to share between threads."""
+
+    def __init__(self, cache: SplitCache, workers: Optional[int] = None, threshold: int = LARGE_TEXT,
+                 max_pending: Optional[int] = None, per_session: int = 2):
+        self.cache = cache
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.threshold = threshold
+        self.max_pending = max_pending or 2 * self.workers
+        self.per_session = per_session
+        self._pool = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._sessions: Dict[str, List[Future]] = {}
+        self._lock = threading.RLock()  # cancelling runs _finished at once
+        self.inline = 0
+        self.dispatched = 0
+        self.rejected = 0
+        self.superseded = 0
+
+    def split(self, text: str, options: Optional[SplitOptions] = None, session: str = "",
+              wait: Optional[Callable[[], None]] = None) -> str:
+        """Like :meth:`SplitCache.split`; raises :class:`Busy` if a large text cannot be taken.
+
+        ``wait`` is called every :data:`POLL_INTERVAL` seconds while a large
+        text is in the pool. Whatever it raises (Streamlit stops a script
+        that way on a rerun) cancels the text.
+        """
+        if len(text) < self.threshold:
+            with self._lock:
+                self.inline += 1
+            return self.cache.split(text, options)
+        return self.cache.split(
+            text, options, lambda text, options: self._dispatch(session, wait, core_split, text, options))
+
+    def split_pieces(self, pieces: Sequence[str], options: SplitOptions, session: str = "",
+                     wait: Optional[Callable[[], None]] = None) -> List[str]:
+        """The core splits of some :meth:`LineMemo.pieces`, in the pool if they add up to a large text."""
+        if sum(map(len, pieces)) < self.threshold:
+            with self._lock:
+                self.inline += 1
+            options = core_options(options)
+            if self.cache.lines is None:
+                return [split_core(piece, options) for piece in pieces]
+            return self.cache.lines.split_pieces(pieces, options)
+        return self._dispatch(session, wait, piece_cores, list(pieces), options)
+
+    def _dispatch(self, session: str, wait, function, work, options: SplitOptions):
+        with self._lock:
+            for future in list(self._sessions.get(session, ())):
+                if future.cancel():  # drops it from the session through _finished
+                    self.superseded += 1
+            futures = self._sessions.setdefault(session, [])
+            if len(futures) >= self.per_session:
+                self.rejected += 1
+                raise Busy("Your previous text is still being split. Please try again in a moment.")
+            if not self._slots.acquire(blocking=False):
+                self.rejected += 1
+                raise Busy("The splitter is busy with other long texts. Please try again in a moment.")
+            try:
+                pool = self._get_pool(options)
+                try:
+                    future = pool.submit(function, work, options)
+                except BrokenProcessPool:
+                    # A worker died since the last text; start a fresh pool once
+                    self._reset_pool(pool)
+                    future = self._get_pool(options).submit(function, work, options)
+            except BaseException:
+                self._slots.release()
+                raise
+            futures.append(future)
+            self.dispatched += 1
+        future.add_done_callback(lambda done: self._finished(session, done))
+        try:
+            while True:
+                try:
+                    return future.result(timeout=POLL_INTERVAL)
+                except TimeoutError:
+                    if wait is not None:
+                        wait()
+                except CancelledError:
+                    raise Busy("A newer text from this session replaced this one.") from None
+                except BrokenProcessPool:
+                    # e.g. the worker ran out of memory; the next text gets a new pool
+                    self._reset_pool(pool)
+                    raise Busy("The splitter stopped while splitting this text. Please try again.") from None
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _get_pool(self, options: SplitOptions):
+        if self._pool is None:
+            # Forking a threaded server is unsafe, so start workers afresh
+            self._pool = start_pool(self.workers, [options], multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _reset_pool(self, pool):
+        """Drop ``pool`` if it is still the current one; a broken pool takes no more work."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finished(self, session: str, future: Future):
+        self._slots.release()
+        with self._lock:
+            futures = self._sessions.get(session)
+            if futures is not None and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self._sessions[session]
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for the debug panel."""
+        with self._lock:
+            return {
+                "inline": self.inline,
+                "dispatched": self.dispatched,
+                "rejected": self.rejected,
+                "superseded": self.superseded,
+                "in_pool": sum(len(futures) for futures in self._sessions.values()),
+                "max_pending": self.max_pending,
+                "threshold": self.threshold,
+            }
+
@@ -0,0 +1,263 @@
+"""Compile the rule stages into a short plan and run it over a text.
+
+Applying the ~2,800 rules one ``str.replace`` at a time copies the text
+once per rule. Most neighbouring rules cannot see each other's output, so
+they are merged into a single pass: one regular expression whose matches
+are looked up in a dict, or a plain substitution when all the rules have
+the same replacement. Rules are only merged while the merged pass is
+guaranteed to give the same text as the replacements one after another;
+small batches still run as separate replacements, which is cheaper.
+"""
+
+import re
+from dataclasses import replace
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .options import DEFAULT_JUNCTURE_SIGN, SplitOptions
+from .rules import (
+    CORE_OPTIONS, CORE_STAGES, END_OF_TEXT, FIRST_LETTER_ONSETS, FIRST_LETTERS, J, JUNCTURE, OUTPUT_STAGES,
+)
+
+
+class Step(NamedTuple):
+    """One pass over the text."""
+
+    # Stage the rules came from (the first one, if the step spans stages)
+    stage: str
+    rules: Tuple[Tuple[str, str], ...]
+    kind: str  # "replace", "regex", "sub" or a special step
+    pattern: Optional["re.Pattern"] = None
+    table: Optional[Dict] = None
+    # "sub" steps: the one replacement, escaped for re.sub
+    repl: Optional[str] = None
+
+
+class _Batch:
+    """Rules that can be applied in one pass.
+
+    A rule may join the batch if its pattern cannot share a character
+    with the pattern or the replacement of any rule already in it: then
+    it neither sees the earlier rules' output nor competes with their
+    matches, and the order within the batch no longer matters.
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.rules: List[Tuple[str, str]] = []
+        self._strings: set = set()
+        self._substrings: set = set()
+        self._prefixes: set = set()
+        self._suffixes: set = set()
+
+    def conflicts(self, old: str) -> bool:
+        # A deletion can bring two characters together for a longer pattern
+        if len(old) > 1 and "" in self._strings or old in self._substrings:
+            return True
+        n = len(old)
+        for i in range(n):
+            for j in range(i + 1, n + 1):
+                if old[i:j] in self._strings:
+                    return True
+        for k in range(1, n):
+            if old[:k] in self._suffixes or old[-k:] in self._prefixes:
+                return True
+        return False
+
+    def add(self, old: str, new: str):
+        self.rules.append((old, new))
+        for string in (old, new):
+            n = len(string)
+            self._strings.add(string)
+            self._substrings.update(string[i:j] for i in range(n + 1) for j in range(i, n + 1))
+            self._prefixes.update(string[:k] for k in range(1, n))
+            self._suffixes.update(string[-k:] for k in range(1, n))
+
+
+def _trie_regex(words) -> str:
+    """A regular expression matching any of ``words``, factored as a trie."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        if "" in node and len(node) == 1:
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        if all(len(b) == 1 for b in branches):
+            body = branches[0] if len(branches) == 1 else "[" + "".join(branches) + "]"
+        else:
+            body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if optional else body
+
+    return build(trie)
+
+
+# Smaller batches are cheaper as one str.replace per rule than as a regex
+# with a Python callback per match
+MIN_REGEX_RULES = 8
+
+
+def _make_step(stage: str, batch: List[Tuple[str, str]]) -> Step:
+    rules = tuple(batch)
+    if len(rules) < MIN_REGEX_RULES:
+        return Step(stage, rules, "replace")
+    pattern = re.compile(_trie_regex(old for old, _ in rules))
+    replacements = {new for _, new in rules}
+    if len(replacements) == 1:
+        return Step(stage, rules, "sub", pattern=pattern, repl=replacements.pop().replace("\\", "\\\\"))
+    return Step(stage, rules, "regex", pattern=pattern, table=dict(rules))
+
+
+def core_options(options: SplitOptions) -> SplitOptions:
+    """``options`` reduced to what the core split depends on."""
+    return SplitOptions(**{name: getattr(options, name) for name in CORE_OPTIONS})
+
+
+def compile_plan(options: SplitOptions, by_stage: bool = False) -> Tuple[Step, ...]:
+    """The steps that split a text with ``options``, in order.
+
+    The juncture sign is only put in by :func:`render`, so all signs share
+    one plan. With ``by_stage``, no step takes rules from more than one
+    stage, so that the time a step takes belongs to one stage (see
+    :mod:`palijuncture.instrument`); the result is the same.
+    """
+    return core_plan(options, by_stage) + output_plan(options, by_stage)
+
+
+def core_plan(options: SplitOptions, by_stage: bool = False) -> Tuple[Step, ...]:
+    """The steps that find the heavy syllables."""
+    return _compile_plan("core", core_options(options), by_stage)
+
+
+def output_plan(options: SplitOptions, by_stage: bool = False) -> Tuple[Step, ...]:
+    """The steps that only change how the split text is shown."""
+    return _compile_plan("output", replace(options, juncture_sign=DEFAULT_JUNCTURE_SIGN), by_stage)
+
+
+@lru_cache(maxsize=64)
+def _compile_plan(part: str, options: SplitOptions, by_stage: bool = False) -> Tuple[Step, ...]:
+    plan: List[Step] = []
+    batch: Optional[_Batch] = None
+
+    for stage in CORE_STAGES if part == "core" else OUTPUT_STAGES:
+        if by_stage and batch:
+            plan.append(_make_step(batch.stage, batch.rules))
+            batch = None
+        if stage in (FIRST_LETTERS, END_OF_TEXT):
+            if batch:
+                plan.append(_make_step(batch.stage, batch.rules))
+            batch = None
+            plan.append(Step(stage, (), stage))
+            continue
+        if stage.when is not None and not stage.when(options):
+            continue
+        for old, new in stage.rules:
+            if old == new:
+                continue
+            if batch is None or batch.conflicts(old):
+                if batch:
+                    plan.append(_make_step(batch.stage, batch.rules))
+                batch = _Batch(stage.name)
+            batch.add(old, new)
+    if batch:
+        plan.append(_make_step(batch.stage, batch.rules))
+    return tuple(plan)
+
+
+# Texts longer than this (in characters) are matched a block at a time
+CHUNK_SIZE = 1 << 16
+
+
+def _chunks(text: str):
+    """Blocks of about CHUNK_SIZE characters, each ending with a line break."""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + CHUNK_SIZE) + 1 or len(text)
+        yield text[start:end]
+        start = end
+
+
+def run_step(step: Step, text: str, original: str) -> str:
+    """Apply one step of a plan; ``original`` is the text before splitting."""
+    if step.kind == "replace":
+        for old, new in step.rules:
+            text = text.replace(old, new)
+        return text
+    if step.kind in ("regex", "sub"):
+        if step.kind == "sub":
+            substitute = step.repl
+        else:
+            table = step.table
+
+            def substitute(match):
+                return table[match.group()]
+
+        if len(text) <= CHUNK_SIZE or any("\n" in old for old, _ in step.rules):
+            return step.pattern.sub(substitute, text)
+        # re.sub keeps a list of every piece of the result until it joins
+        # them; going through the text a block of lines at a time keeps
+        # that list short. No match can span a line break here.
+        return "".join(step.pattern.sub(substitute, chunk) for chunk in _chunks(text))
+    if step.kind == FIRST_LETTERS:
+        # A text starting with one of these clusters has it joined again
+        if original[:2] in FIRST_LETTER_ONSETS:
+            first, second = original[0], original[1]
+            return text.replace(first + J + second, first + second, 1)
+        return text
+    if step.kind == END_OF_TEXT:
+        if original == "":
+            return text
+        text += J + J
+        text = text.replace(J * 3, J * 2)
+        return text.replace(J * 3, J * 2)
+    raise ValueError(f"unknown step kind: {step.kind!r}")
+
+
+def split_text(text: str, options: Optional[SplitOptions] = None) -> str:
+    """Insert juncture signs into a Pāḷi text.
+
+    >>> split_text("Evaṃ me sutaṃ")
+    'E ― vaṃ ―  me ―  sutaṃ ―  ― '
+    """
+    if options is None:
+        options = SplitOptions()
+    return render(split_marked(text, options), options)
+
+
+def split_marked(text: str, options: SplitOptions) -> str:
+    """Split a text, leaving the internal marker in place of the juncture sign.
+
+    The result does not depend on ``options.juncture_sign``.
+    """
+    return finish_split(split_core(text, options), text, options)
+
+
+def split_core(text: str, options: SplitOptions) -> str:
+    """Run the core stages: the heavy syllables get their juncture signs.
+
+    Only the options in ``CORE_OPTIONS`` matter here.
+    """
+    result = text
+    for step in core_plan(options):
+        result = run_step(step, result, text)
+    return result
+
+
+def finish_split(core: str, text: str, options: SplitOptions) -> str:
+    """Run the output stages on the result of :func:`split_core` for ``text``."""
+    result = core
+    for step in output_plan(options):
+        result = run_step(step, result, text)
+    return result
+
+
+def render(text: str, options: SplitOptions) -> str:
+    """Put the chosen juncture sign in place of the internal marker."""
+    return text.replace(JUNCTURE, options.juncture_sign or DEFAULT_JUNCTURE_SIGN)
@@ -0,0 +1,221 @@
+"""Export split text as plain text, Markdown, HTML, ODT or EPUB.
+
+Every format is written to a binary file a line at a time, straight from
+a generator of split lines such as :func:`palijuncture.split_lines`, so a
+chant book of hundreds of pages is never held in memory as a whole. ODT
+and EPUB are zip containers built with :mod:`zipfile`; their text goes
+into the archive through a stream too.
+
+    with open("chants.epub", "wb") as out:
+        export(split_lines(open("chants.txt", encoding="utf-8")), out, "epub", title="Chants")
+
+Blank lines separate paragraphs (stanzas); the other line breaks are
+kept inside a paragraph, as on the page.
+"""
+
+import datetime
+import html
+import re
+import uuid
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List
+
+# Format -> (file extension, MIME type)
+FORMATS = {
+    "txt": (".txt", "text/plain"),
+    "md": (".md", "text/markdown"),
+    "html": (".html", "text/html"),
+    "odt": (".odt", "application/vnd.oasis.opendocument.text"),
+    "epub": (".epub", "application/epub+zip"),
+}
+# Lines per EPUB chapter file; readers page through small files faster
+EPUB_CHAPTER_LINES = 2000
+
+STYLE = """body { font-family: "Gentium Plus", "Noto Serif", Georgia, serif; line-height: 1.6;
+       max-width: 40em; margin: 2em auto; padding: 0 1em; }
+p { margin: 0 0 1em 0; }"""
+
+
+# Characters XML 1.0 does not allow, not even as references (e.g. the form feed
+# between pages of some texts); lone surrogates cannot be written as UTF-8
+_NOT_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def _escape(text: str, quote: bool = True) -> str:
+    """``text`` escaped for HTML and XML, without the characters XML does not allow."""
+    return html.escape(_NOT_XML.sub("", text), quote=quote)
+
+
+def paragraphs(lines: Iterable[str]) -> Iterator[List[str]]:
+    """The lines grouped into paragraphs at blank lines, without line ends."""
+    paragraph = []
+    for line in lines:
+        line = line.rstrip()
+        if line:
+            paragraph.append(line)
+        elif paragraph:
+            yield paragraph
+            paragraph = []
+    if paragraph:
+        yield paragraph
+
+
+def _write_text(lines: Iterable[str], out: BinaryIO, title: str):
+    for line in lines:
+        out.write(line.encode("utf-8"))
+
+
+def _write_markdown(lines: Iterable[str], out: BinaryIO, title: str):
+    out.write(f"# {title}\n\n".encode("utf-8"))
+    # The split lines already end with Markdown's hard line break
+    _write_text(lines, out, title)
+
+
+def _html_paragraph(paragraph: List[str]) -> str:
+    return "<p>" + "<br/>\n".join(_escape(line, quote=False) for line in paragraph) + "</p>\n"
+
+
+def _write_html(lines: Iterable[str], out: BinaryIO, title: str):
+    out.write((
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\"/>\n"
+        f"<title>{_escape(title)}</title>\n<style>\n{STYLE}\n</style>\n</head>\n<body>\n"
+        f"<h1>{_escape(title)}</h1>\n"
+    ).encode("utf-8"))
+    for paragraph in paragraphs(lines):
+        out.write(_html_paragraph(paragraph).encode("utf-8"))
+    out.write(b"</body>\n</html>\n")
+
+
+ODT_MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" manifest:version="1.2">
+ <manifest:file-entry manifest:full-path="/" manifest:media-type="application/vnd.oasis.opendocument.text"/>
+ <manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>
+ <manifest:file-entry manifest:full-path="styles.xml" manifest:media-type="text/xml"/>
+</manifest:manifest>
+"""
+ODT_NAMESPACES = (
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0" office:version="1.2"'
+)
+ODT_STYLES = f"""<?xml version="1.0" encoding="UTF-8"?>
+<office:document-styles {ODT_NAMESPACES}>
+ <office:styles>
+  <style:style style:name="Standard" style:family="paragraph">
+   <style:paragraph-properties fo:margin-bottom="0.25cm" fo:line-height="150%"/>
+   <style:text-properties style:font-name="Gentium Plus" fo:font-size="12pt"/>
+  </style:style>
+  <style:style style:name="Title" style:family="paragraph" style:parent-style-name="Standard">
+   <style:text-properties fo:font-size="18pt" fo:font-weight="bold"/>
+  </style:style>
+ </office:styles>
+</office:document-styles>
+"""
+
+
+def _write_odt(lines: Iterable[str], out: BinaryIO, title: str):
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as odt:
+        # The MIME type must come first and uncompressed
+        odt.writestr(zipfile.ZipInfo("mimetype"), FORMATS["odt"][1], compress_type=zipfile.ZIP_STORED)
+        odt.writestr("META-INF/manifest.xml", ODT_MANIFEST)
+        odt.writestr("styles.xml", ODT_STYLES)
+        with odt.open("content.xml", "w") as content:
+            content.write((
+                f'<?xml version="1.0" encoding="UTF-8"?>\n<office:document-content {ODT_NAMESPACES}>\n'
+                f' <office:body>\n  <office:text>\n'
+                f'   <text:p text:style-name="Title">{_escape(title, quote=False)}</text:p>\n'
+            ).encode("utf-8"))
+            for paragraph in paragraphs(lines):
+                body = "<text:line-break/>".join(_escape(line, quote=False) for line in paragraph)
+                content.write(f'   <text:p text:style-name="Standard">{body}</text:p>\n'.encode("utf-8"))
+            content.write(b"  </office:text>\n </office:body>\n</office:document-content>\n")
+
+
+EPUB_CONTAINER = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+ <rootfiles>
+  <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+ </rootfiles>
+</container>
+"""
+
+
+def _xhtml_head(title: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<!DOCTYPE html>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">\n'
+        f'<head>\n<meta charset="utf-8"/>\n<title>{_escape(title)}</title>\n'
+        '<link rel="stylesheet" type="text/css" href="style.css"/>\n</head>\n<body>\n'
+    )
+
+
+def _write_epub(lines: Iterable[str], out: BinaryIO, title: str):
+    chapters = []
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as epub:
+        epub.writestr(zipfile.ZipInfo("mimetype"), FORMATS["epub"][1], compress_type=zipfile.ZIP_STORED)
+        epub.writestr("META-INF/container.xml", EPUB_CONTAINER)
+        epub.writestr("OEBPS/style.css", STYLE + "\n")
+        chapter = None
+        count = 0
+        for paragraph in paragraphs(lines):
+            if chapter is None:
+                name = f"text{len(chapters) + 1:04d}.xhtml"
+                chapters.append(name)
+                chapter = epub.open("OEBPS/" + name, "w")
+                chapter.write(_xhtml_head(title).encode("utf-8"))
+                if len(chapters) == 1:
+                    chapter.write(f"<h1>{_escape(title)}</h1>\n".encode("utf-8"))
+            chapter.write(_html_paragraph(paragraph).encode("utf-8"))
+            count += len(paragraph)
+            if count >= EPUB_CHAPTER_LINES:
+                chapter.write(b"</body>\n</html>\n")
+                chapter.close()
+                chapter, count = None, 0
+        if not chapters:  # an empty text still needs a page
+            chapters.append("text0001.xhtml")
+            epub.writestr("OEBPS/text0001.xhtml",
+                          _xhtml_head(title) + f"<h1>{_escape(title)}</h1>\n</body>\n</html>\n")
+        elif chapter is not None:
+            chapter.write(b"</body>\n</html>\n")
+            chapter.close()
+
+        # The package and the table of contents go last, once the chapters are known
+        nav = "".join(f'<li><a href="{name}">{_escape(title)} ({i})</a></li>\n'
+                      for i, name in enumerate(chapters, 1))
+        epub.writestr("OEBPS/nav.xhtml", _xhtml_head(title)
+                      + f'<nav epub:type="toc"><h1>{_escape(title)}</h1>\n<ol>\n{nav}</ol>\n</nav>\n</body>\n</html>\n')
+        manifest = "".join(f'  <item id="c{i}" href="{name}" media-type="application/xhtml+xml"/>\n'
+                           for i, name in enumerate(chapters, 1))
+        spine = "".join(f'  <itemref idref="c{i}"/>\n' for i in range(1, len(chapters) + 1))
+        modified = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        epub.writestr("OEBPS/content.opf", (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">\n'
+            ' <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+            f'  <dc:identifier id="id">urn:uuid:{uuid.uuid4()}</dc:identifier>\n'
+            f'  <dc:title>{_escape(title)}</dc:title>\n'
+            '  <dc:language>pi</dc:language>\n'
+            f'  <meta property="dcterms:modified">{modified}</meta>\n'
+            ' </metadata>\n <manifest>\n'
+            '  <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>\n'
+            '  <item id="css" href="style.css" media-type="text/css"/>\n'
+            f'{manifest} </manifest>\n <spine>\n{spine} </spine>\n</package>\n'
+        ))
+
+
+WRITERS: Dict[str, Callable[[Iterable[str], BinaryIO, str], None]] = {
+    "txt": _write_text,
+    "md": _write_markdown,
+    "html": _write_html,
+    "odt": _write_odt,
+    "epub": _write_epub,
+}
+
+
+def export(lines: Iterable[str], out: BinaryIO, fmt: str = "txt", title: str = "Split Pāḷi text"):
+    """Write the split ``lines`` to the binary file ``out`` as ``fmt`` (one of :data:`FORMATS`)."""
+    if fmt not in WRITERS:
+        raise ValueError(f"unknown export format: {fmt!r} (use one of {', '.join(FORMATS)})")
+    WRITERS[fmt](lines, out, title)
+
@@ -0,0 +1,200 @@
+"""Re-split only the lines of a text that changed since the last split.
+
+People edit long chant texts a line at a time, and every edit used to
+split the whole text again. :class:`LineSplits` keeps the split of every
+line of the last text it saw, keyed by the line and everything around it
+that can change its split. No rule reaches across a line break (see
+:mod:`palijuncture.memo`), so that context is small:
+
+* whether the line is the first (no line break in front) or the last
+  (it gets the closing double juncture sign);
+* which cluster, if any, the text starts with and is still waiting to be
+  rejoined when the line comes (see :mod:`palijuncture.stream`).
+
+An edit inside one line runs the rules on that line alone; the rest is
+dictionary lookups. Keep one per session (e.g. in Streamlit's
+``session_state``): it holds the lines of one text for one set of
+options.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .engine import core_options, output_plan, render
+from .memo import piece_cores
+from .options import SplitOptions
+from .rules import FIRST_LETTER_ONSETS
+from .stream import _LINE_BREAK, finish_segment
+
+# Lines split together when new lines come, at first and at most
+FIRST_RUN = 16
+MAX_RUN = 1024
+
+
+class LineSplits:
+    """The split of one text, line by line, reused across edits."""
+
+    def __init__(self):
+        self.options: Optional[SplitOptions] = None
+        # (line, is first) -> core split of the line
+        self._cores: Dict[Tuple[str, bool], str] = {}
+        # (line, is first, is last, cluster to rejoin) -> (split line, rejoined it)
+        self._splits: Dict[Tuple[str, bool, bool, str], Tuple[str, bool]] = {}
+        self.reused = 0
+        self.resplit = 0
+
+    def split(self, text: str, options: Optional[SplitOptions] = None,
+              split_pieces: Optional[Callable[[Sequence[str], SplitOptions], List[str]]] = None,
+              split_text: Optional[Callable[[str, SplitOptions], str]] = None) -> str:
+        """Same result as :func:`palijuncture.split_text`.
+
+        ``split_pieces`` gives the core splits of new lines all at once (as
+        pieces with their line breaks, like :meth:`palijuncture.LineMemo.pieces`),
+        e.g. :meth:`palijuncture.dispatch.SplitDispatcher.split_pieces`; by
+        default they are split here one by one. When most of the text is new,
+        ``split_text`` (if given) splits it whole instead, which is faster
+        than line by line, and the lines are taken from its result.
+        """
+        if options is None:
+            options = SplitOptions()
+        self._set_options(options)
+        segments = _segments(text)
+        last = len(segments) - 1
+        first = text[:2] if text[:2] in FIRST_LETTER_ONSETS else ""
+
+        # The lines that need a core split: those with nothing to reuse,
+        # or every line from the first of them on while the cluster at the
+        # start of the text may still be rejoined further down
+        needed = {}
+        pending = first
+        for i, segment in enumerate(segments):
+            done = self._splits.get((segment, i == 0, i == last, pending))
+            if done is not None:
+                if done[1]:
+                    pending = ""
+                continue
+            for j in range(i, len(segments) if pending else i + 1):
+                key = (segments[j], j == 0)
+                if key not in self._cores:
+                    needed[key] = ("\n" if j else "") + segments[j]
+            if pending:
+                break
+
+        if split_text is not None and not first and len(needed) > len(segments) // 2:
+            # Every line of the result ends where its input line ends
+            result = split_text(text, options)
+            split_lines = result.split("\n")
+            self._splits = {(segment, i == 0, i == last, ""): (split_lines[i] + ("\n" if i < last else ""), False)
+                            for i, segment in enumerate(segments)}
+            self._cores = {key[:2]: self._cores[key[:2]] for key in self._splits if key[:2] in self._cores}
+            self.resplit += len(segments)
+            return result
+
+        if needed and split_pieces is not None:
+            self._cores.update(zip(needed, split_pieces(list(needed.values()), options)))
+
+        return "".join(self._split_lines(text, options, segments))
+
+    def iter_split(self, text: str, options: Optional[SplitOptions] = None,
+                   split_pieces: Optional[Callable[[Sequence[str], SplitOptions], List[str]]] = None
+                   ) -> Iterator[str]:
+        """Like :meth:`split`, but yields the split lines one by one as they are ready.
+
+        New lines are split as they come, a few at first and then in runs
+        twice as long each time, so the first lines of a long new text are
+        out at once without splitting every line on its own. Each run goes
+        to ``split_pieces`` if given (e.g. :meth:`palijuncture.LineMemo.split_pieces`).
+        What was split is kept for the next edit once the generator has
+        run to the end.
+        """
+        if options is None:
+            options = SplitOptions()
+        self._set_options(options)
+        return self._split_lines(text, options, _segments(text), split_pieces)
+
+    def _set_options(self, options: SplitOptions):
+        if options != self.options:
+            if self.options is None or core_options(options) != core_options(self.options):
+                self._cores.clear()
+            self._splits.clear()
+            self.options = options
+
+    def _split_lines(self, text: str, options: SplitOptions, segments: List[str],
+                     split_pieces=None) -> Iterator[str]:
+        plan = output_plan(options)
+        reduced = core_options(options)
+        last = len(segments) - 1
+        pending = text[:2] if text[:2] in FIRST_LETTER_ONSETS else ""
+        cores = {}
+        splits = {}
+        run = FIRST_RUN
+        i = 0
+        while i <= last:
+            key = (segments[i], i == 0, i == last, pending)
+            done = splits.get(key) or self._splits.get(key)
+            if done is not None:
+                self.reused += 1
+                if (segments[i], i == 0) in self._cores:
+                    cores[(segments[i], i == 0)] = self._cores[(segments[i], i == 0)]
+                splits[key] = done
+                if done[1]:
+                    pending = ""
+                yield done[0]
+                i += 1
+                continue
+            # The lines from here that are new; while the cluster at the
+            # start still waits to be rejoined, one at a time
+            end = i + 1
+            while (not pending and end <= last and end - i < run
+                   and (segments[end], False, end == last, "") not in self._splits):
+                end += 1
+            for k in range(i, end):
+                if (segments[k], k == 0) not in self._cores:
+                    self._split_run(segments, k, end - k, reduced, split_pieces)
+            run = min(run * 2, MAX_RUN)
+            block = []
+            for k in range(i, end):
+                core = self._cores[(segments[k], k == 0)]
+                cores[(segments[k], k == 0)] = core
+                block.append(core[len(_LINE_BREAK):] if k else core)
+            state = {"first": pending, "rejoin_first": bool(pending), "empty": text == ""}
+            # The output stages do not reach across line breaks either
+            lines = finish_segment("".join(block), end - 1 == last, plan, state).split("\n")
+            rejoined = bool(pending) and not state["rejoin_first"]
+            for k in range(i, end):
+                line = lines[k - i] + ("\n" if k < last else "")
+                done = (render(line, options), rejoined)
+                splits[(segments[k], k == 0, k == last, pending)] = done
+                self.resplit += 1
+                yield done[0]
+            if rejoined:
+                pending = ""
+            i = end
+        # Only the lines of this text are kept
+        self._cores = cores
+        self._splits = splits
+
+    def _split_run(self, segments: List[str], start: int, most: int, options: SplitOptions,
+                   split_pieces=None):
+        """Split the lines from ``start`` on that have no core split yet, up to ``most`` of them."""
+        end = start + 1
+        while end < len(segments) and end - start < most and (segments[end], False) not in self._cores:
+            end += 1
+        if split_pieces is not None:
+            cores = split_pieces([("\n" if i else "") + segments[i] for i in range(start, end)], options)
+        else:
+            cores = piece_cores(("\n" if start else "") + "".join(segments[start:end]), options)
+            # Drop the empty line in front and the one after the last line break
+            cores = cores[1:] if start else cores
+        for i, core in zip(range(start, end), cores):
+            self._cores[(segments[i], i == 0)] = core
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for the debug panel."""
+        return {"lines": len(self._splits), "reused": self.reused, "resplit": self.resplit}
+
+
+def _segments(text: str) -> List[str]:
+    """The lines of ``text``, each with its line break."""
+    lines = text.split("\n")
+    last = len(lines) - 1
+    return [line + "\n" if i < last else line for i, line in enumerate(lines)]
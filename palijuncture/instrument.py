@@ -0,0 +1,242 @@
+"""Per-stage timing and allocation counts for the splitting pipeline.
+
+The rule tables are grouped into named stages (see
+:mod:`palijuncture.rules`): long vowels, double consonants, the ṃ/ṁ
+groups, the h/y/l/s/v clusters, saṃyoga pauses, punctuation,
+transliteration and so on. :class:`StageProfile` splits a text with a
+plan in which no pass mixes rules from two stages, and records for each
+stage the wall time, the bytes allocated and how many replacements
+actually fired. This is opt-in and costs a little on top of a plain
+split (replacements are counted, and the passes are smaller); nothing
+else in the package pays for it.
+
+    profile = StageProfile()
+    profile.split(text, options)
+    print(profile.to_json())
+
+Allocations are measured with :mod:`tracemalloc`, which slows everything
+several times over, so they are only recorded with ``memory=True``.
+From the command line::
+
+    python -m palijuncture.instrument chants.txt --memory --json stages.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from .engine import CHUNK_SIZE, Step, _chunks, compile_plan, render, run_step
+from .options import SplitOptions, add_option_arguments, options_from_arguments
+from .rules import END_OF_TEXT, J, JUNCTURE
+
+RENDER = "render"
+
+
+def run_counted(step: Step, text: str, original: str) -> Tuple[str, int]:
+    """Apply one step like :func:`run_step`; also returns how many replacements fired."""
+    if step.kind == "replace":
+        fired = 0
+        for old, new in step.rules:
+            count = text.count(old)
+            if count:
+                fired += count
+                text = text.replace(old, new)
+        return text, fired
+    if step.kind in ("regex", "sub"):
+        if step.kind == "sub":
+            substitute = step.repl
+        else:
+            table = step.table
+
+            def substitute(match):
+                return table[match.group()]
+
+        if len(text) <= CHUNK_SIZE or any("\n" in old for old, _ in step.rules):
+            return step.pattern.subn(substitute, text)
+        parts, fired = [], 0
+        for chunk in _chunks(text):
+            part, count = step.pattern.subn(substitute, chunk)
+            parts.append(part)
+            fired += count
+        return "".join(parts), fired
+    if step.kind == END_OF_TEXT:
+        result = run_step(step, text, original)
+        if original == "":
+            return result, 0
+        # The double sign put at the end, then every run of three made two
+        return result, 1 + (len(text) + 2 * len(J) - len(result)) // len(J)
+    result = run_step(step, text, original)
+    return result, int(result != text)
+
+
+class StageStats:
+    """What one stage cost over every text split so far."""
+
+    __slots__ = ("passes", "seconds", "allocated", "peak", "replacements", "rules")
+
+    def __init__(self):
+        self.passes = 0
+        self.seconds = 0.0
+        self.allocated = 0
+        self.peak = 0
+        self.replacements = 0
+        self.rules = 0
+
+    def as_dict(self) -> Dict:
+        return {
+            "passes": self.passes,
+            "ms": round(self.seconds * 1000, 3),
+            "allocated_bytes": self.allocated,
+            "peak_bytes": self.peak,
+            "replacements": self.replacements,
+            "rules": self.rules,
+        }
+
+
+class StageProfile:
+    """Wall time, allocations and replacements fired per named stage.
+
+    ``allocated_bytes`` is the memory still held after the stage minus
+    that before it (mostly the new copy of the text less the old one, so
+    it can be negative) and ``peak_bytes`` the most the stage held at
+    once on top of what was there before; both are only recorded with
+    ``memory=True``.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.stages: Dict[str, StageStats] = {}
+        self.texts = 0
+        self.characters = 0
+        self.seconds = 0.0
+
+    def _stats(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    def split(self, text: str, options: Optional[SplitOptions] = None) -> str:
+        """Split ``text`` as :func:`palijuncture.split_text` does, recording every stage."""
+        if options is None:
+            options = SplitOptions()
+        plan = compile_plan(options, by_stage=True)
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result = text
+            for step in plan:
+                result = self._run(step.stage, run_counted, step, result, text)
+            result = self._run(RENDER, lambda text, options: (render(text, options), text.count(JUNCTURE)),
+                               result, options)
+            self.seconds += time.perf_counter() - start
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        rules: Dict[str, int] = {}
+        for step in plan:
+            rules[step.stage] = rules.get(step.stage, 0) + len(step.rules)
+        for name, count in rules.items():
+            self.stages[name].rules = count
+        self.texts += 1
+        self.characters += len(text)
+        return result
+
+    def _run(self, name: str, function, *args) -> str:
+        stats = self._stats(name)
+        if self.memory:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result, fired = function(*args)
+        stats.seconds += time.perf_counter() - start
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            stats.allocated += current - before
+            stats.peak = max(stats.peak, peak - before)
+        stats.passes += 1
+        stats.replacements += fired
+        return result
+
+    def reset(self):
+        self.stages.clear()
+        self.texts = self.characters = 0
+        self.seconds = 0.0
+
+    def ranked(self) -> List[Tuple[str, StageStats]]:
+        """The stages, slowest first."""
+        return sorted(self.stages.items(), key=lambda item: item[1].seconds, reverse=True)
+
+    def as_dict(self) -> Dict:
+        return {
+            "texts": self.texts,
+            "characters": self.characters,
+            "ms": round(self.seconds * 1000, 3),
+            "memory": self.memory,
+            # In the order the stages run
+            "stages": {name: stats.as_dict() for name, stats in self.stages.items()},
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), ensure_ascii=False, indent=indent)
+
+    def table(self, top: Optional[int] = None) -> str:
+        """The stages as a text table, slowest first."""
+        header = f"{'stage':34} {'ms':>9} {'share':>6} {'fired':>9} {'rules':>6}"
+        rows = [header + (f" {'alloc KB':>9} {'peak KB':>9}" if self.memory else "")]
+        total = sum(stats.seconds for stats in self.stages.values()) or 1.0
+        for name, stats in self.ranked()[:top]:
+            row = (f"{name:34} {stats.seconds * 1000:9.3f} {stats.seconds / total:6.1%} "
+                   f"{stats.replacements:9,} {stats.rules:6}")
+            if self.memory:
+                row += f" {stats.allocated / 1024:9.1f} {stats.peak / 1024:9.1f}"
+            rows.append(row)
+        return "\n".join(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture.instrument",
+                                     description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", nargs="*", metavar="FILE", help="text to split (default: standard input)")
+    parser.add_argument("--memory", action="store_true", help="also trace allocations (much slower)")
+    parser.add_argument("--repeat", type=int, default=1, help="split each text this many times")
+    parser.add_argument("--json", metavar="FILE", help="write the profile as JSON here ('-' for standard output)")
+    parser.add_argument("--top", type=int, default=None, help="only list the slowest stages")
+    add_option_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        options = options_from_arguments(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    texts = []
+    for path in args.paths or ["-"]:
+        if path == "-":
+            texts.append(sys.stdin.read())
+        else:
+            with open(path, encoding="utf-8") as f:
+                texts.append(f.read())
+    compile_plan(options, by_stage=True)  # compiling is not a stage
+    profile = StageProfile(memory=args.memory)
+    for _ in range(args.repeat):
+        for text in texts:
+            profile.split(text, options)
+
+    if args.json == "-":
+        print(profile.to_json())
+        return 0
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(profile.to_json() + "\n")
+    print(profile.table(args.top))
+    print(f"{profile.texts} splits, {profile.characters:,} characters in {profile.seconds * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
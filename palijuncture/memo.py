@@ -0,0 +1,187 @@
+"""Memoize the core split one line at a time.
+
+Chants and the canon repeat the same lines over and over (refrains,
+stock passages, the same verse in many suttas). No core rule reaches
+across a line break: every pattern with a ``"\\n"`` in it starts or ends
+with it. So each line can be split on its own, together with the line
+breaks around it, and the pieces joined back give exactly the core split
+of the whole text.
+
+Words are not independent in the same way. The juncture sign carries its
+own spaces, and the rules for m before a space, word-initial clusters and
+pauses before punctuation all look across the space between two words.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from .engine import core_options, split_core
+from .options import SplitOptions
+
+DEFAULT_MAX_LINES = 50_000
+# Lines and their splits together; the memo is shared by every session
+DEFAULT_MAX_BYTES = 32 * 2 ** 20
+# Longer lines (whole prose paragraphs) rarely repeat and are not kept
+MAX_LINE_LENGTH = 4096
+
+# What the line break in front of a line turns into
+_LINE_BREAK = "  \n"
+
+
+def piece_cores(text: str, options: SplitOptions) -> List[str]:
+    """The core split of each of :meth:`LineMemo.pieces`, from one split of ``text``.
+
+    The same as splitting every piece on its own, but with one pass of
+    each rule over the whole text instead of one per line: the core split
+    keeps each line break of the text, so it can be cut back into lines.
+    """
+    parts = split_core(text, options).split("\n")
+    if len(parts) != text.count("\n") + 1:  # never seen; but stay correct
+        return [split_core(piece, options) for piece in LineMemo.pieces(text)]
+    last = len(parts) - 1
+    return [(_LINE_BREAK if i else "") + part + ("\n" if i < last else "") for i, part in enumerate(parts)]
+
+
+def _size(piece: str, core: str) -> int:
+    return sys.getsizeof(piece) + sys.getsizeof(core)
+
+
+class LineMemo:
+    """LRU of core splits of single lines. Safe to share between threads.
+
+    Holds at most ``max_lines`` lines and ``max_bytes`` of lines and
+    their splits together. Lines that are not in memory are looked up in ``store`` (a
+    :class:`palijuncture.store.SplitStore`) before they are split.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, store=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.store = store
+        self._lines: "OrderedDict[tuple, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+
+    @staticmethod
+    def pieces(text: str):
+        """The lines of ``text``, each with the line breaks on both sides.
+
+        The line breaks belong to the piece so that the rules for line
+        starts and line ends still fire.
+        """
+        lines = text.split("\n")
+        last = len(lines) - 1
+        for i, line in enumerate(lines):
+            yield ("\n" if i else "") + line + ("\n" if i < last else "")
+
+    def split_core(self, text: str, options: SplitOptions) -> str:
+        """Same result as :func:`palijuncture.engine.split_core`."""
+        options = core_options(options)  # once, rather than for every line
+        parts = []
+        for i, piece in enumerate(self.pieces(text)):
+            core = self.split_piece(piece, options)
+            parts.append(core[len(_LINE_BREAK):] if i else core)
+        return "".join(parts)
+
+    def split_piece(self, piece: str, options: SplitOptions) -> str:
+        """The core split of one of :meth:`pieces`, memoized.
+
+        ``options`` must already be reduced by ``core_options``.
+        """
+        if len(piece) > MAX_LINE_LENGTH:
+            return split_core(piece, options)
+        core = self._lookup(piece, options)
+        if core is None:
+            core = split_core(piece, options)
+            self._keep(piece, core, options)
+        return core
+
+    def split_pieces(self, pieces: Sequence[str], options: SplitOptions) -> List[str]:
+        """:meth:`split_piece` for each of ``pieces``, with the new lines split together.
+
+        Lines with a line break on both sides that are neither in memory
+        nor in the store get one pass of the rules between them, as in
+        :func:`piece_cores`. ``options`` must already be reduced by ``core_options``.
+        """
+        cores: List[Optional[str]] = [None] * len(pieces)
+        new: Dict[str, List[int]] = {}
+        for i, piece in enumerate(pieces):
+            if piece in new:
+                new[piece].append(i)
+                continue
+            if len(piece) > MAX_LINE_LENGTH:
+                cores[i] = split_core(piece, options)
+                continue
+            cores[i] = self._lookup(piece, options)
+            if cores[i] is None:
+                if len(piece) > 1 and piece[0] == "\n" and piece[-1] == "\n":
+                    new[piece] = [i]
+                else:  # the first or last line of a text
+                    cores[i] = split_core(piece, options)
+                    self._keep(piece, cores[i], options)
+        if new:
+            # With an empty line in front and one after, both dropped
+            text = "\n" + "".join(piece[1:] for piece in new)
+            for (piece, indexes), core in zip(new.items(), piece_cores(text, options)[1:-1]):
+                self._keep(piece, core, options)
+                for i in indexes:
+                    cores[i] = core
+        return cores
+
+    def _lookup(self, piece: str, options: SplitOptions) -> Optional[str]:
+        """The core split of ``piece`` from memory or the store, or None."""
+        key = (piece, options)
+        with self._lock:
+            core = self._lines.get(key)
+            if core is not None:
+                self._lines.move_to_end(key)
+                self.hits += 1
+                return core
+            self.misses += 1
+        core = self.store.get(piece, options) if self.store else None
+        if core is not None:
+            with self._lock:
+                self.store_hits += 1
+            self._remember(key, core)
+        return core
+
+    def _keep(self, piece: str, core: str, options: SplitOptions):
+        """Keep a new split in memory and in the store."""
+        if self.store:
+            self.store.put(piece, core, options)
+        self._remember((piece, options), core)
+
+    def _remember(self, key, core: str):
+        size = _size(key[0], core)
+        with self._lock:
+            if key in self._lines or size > self.max_bytes:
+                return
+            self._lines[key] = core
+            self._bytes += size
+            while len(self._lines) > self.max_lines or self._bytes > self.max_bytes:
+                (evicted, _), evicted_core = self._lines.popitem(last=False)
+                self._bytes -= _size(evicted, evicted_core)
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "store_hits": self.store_hits,
+                "lines": len(self._lines),
+                "max_lines": self.max_lines,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
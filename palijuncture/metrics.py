@@ -0,0 +1,74 @@
+"""A ring buffer of what each split on the page cost, for the performance dashboard.
+
+The page records one :class:`RequestMetrics` entry per run: how long the
+text was, how long it took, which way it was split, how many cache hits
+and misses it had and, if ``profile_every`` is set, for every
+``profile_every``-th run of a short text the time per rule stage (see
+:mod:`palijuncture.instrument`). Profiling splits the text a second
+time, so it is off unless an operator turns it on (on the page, with the
+``PALIJUNCTURE_PROFILE_EVERY`` environment variable). Only
+the last :data:`DEFAULT_SIZE` runs are kept, in memory, for the life of
+the process; nothing is written anywhere.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+DEFAULT_SIZE = 2000
+# One run in this many has its stages profiled (0: never)
+PROFILE_EVERY = 0
+
+
+class RequestMetrics:
+    """The last ``size`` runs, safe to record into from every session's thread."""
+
+    def __init__(self, size: int = DEFAULT_SIZE, profile_every: int = PROFILE_EVERY):
+        self.size = size
+        self.profile_every = profile_every
+        self._entries: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.started = time.time()
+
+    def should_profile(self) -> bool:
+        """Whether the next run should have its stages profiled."""
+        return self.profile_every > 0 and self.recorded % self.profile_every == 0
+
+    def record(self, path: str, chars: int, lines: int, ms: float, first_ms: Optional[float] = None,
+               counters: Optional[Dict[str, int]] = None, stages: Optional[Dict[str, float]] = None):
+        """Keep one run.
+
+        ``path`` is how the text was split ("lines", "pool", "upload", ...),
+        ``counters`` what cache counters such as ``cache_hits`` went up by
+        during the run, and ``stages`` milliseconds per rule stage, if
+        profiled.
+        """
+        entry = {
+            "time": time.time(),
+            "path": path,
+            "chars": chars,
+            "lines": lines,
+            "ms": ms,
+            "first_ms": first_ms,
+            "counters": dict(counters or {}),
+            "stages": dict(stages) if stages else None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+
+    def entries(self) -> List[Dict]:
+        """A copy of the kept runs, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {"recorded": self.recorded, "kept": len(self._entries), "size": self.size,
+                    "uptime_s": round(time.time() - self.started, 1)}
@@ -0,0 +1,126 @@
+"""Splitting options, mirroring the customization panel of the Streamlit page."""
+
+from dataclasses import dataclass, fields, replace
+
+DEFAULT_JUNCTURE_SIGN = "―"
+
+# Sidebar labels -> option values. The page shows the labels, everything
+# else (the core splitter, batch jobs) works with the short values.
+TRANSLITERATIONS = {
+    "Do not convert": "none",
+    "IAST / International Alphabet of Sanskrit Transliteration (1894) & ALA-LC / American Library Association – Library of Congress (2012)": "iast",
+    "ISO 15919: Pāḷi (2001)": "iso",
+    "Velthuis (1983)": "velthuis",
+}
+NIGGAHITA = {
+    "None": "none",
+    "ṃ, ṁ → ng": "ng",
+    "ṃ, ṁ → m": "m",
+}
+V_W = {
+    "None": "none",
+    "if preceded by a consonant in the same syllable, 'v' → 'w'": "conjunct",
+    "all 'v' → 'w'": "v_to_w",
+    "all 'w' → 'v'": "w_to_v",
+}
+
+
+@dataclass(frozen=True)
+class SplitOptions:
+    """How a text should be split and shown.
+
+    The defaults give the same result as the page with an untouched sidebar.
+    """
+
+    # Customize your own juncture sign (rendered with a space on each side)
+    juncture_sign: str = DEFAULT_JUNCTURE_SIGN
+    # Show hidden punctuation marks
+    show_punctuation: bool = False
+    # Hide hyphens and apostrophes
+    hide_hyphens: bool = False
+    # Split text in UPPERCASE
+    uppercase: bool = False
+    # Saṃyoga/continuous chanting style
+    samyoga_pauses: bool = False
+    # Convert transliteration standard to: none, iast, iso or velthuis
+    transliteration: str = "none"
+    # ññ → nñ
+    nasal_nn: bool = False
+    # ṅ → ng
+    nasal_ng: bool = False
+    # ṃ, ṁ → ng or m: none, ng or m
+    niggahita: str = "none"
+    # v ⇄ w: none, conjunct, v_to_w or w_to_v
+    v_w: str = "none"
+    # Medial anusvāra/niggahīta to nasal (gaṃgā → gaṅgā)
+    medial_nasal: bool = False
+
+    def __post_init__(self):
+        # Options also come from JSON (the pipe, the service); a wrong type
+        # would only fail deep inside the rules
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if not isinstance(value, field.type):
+                kind = "true or false" if field.type is bool else "a string"
+                raise ValueError(f"{field.name} must be {kind}, not {value!r}")
+        if self.transliteration not in TRANSLITERATIONS.values():
+            raise ValueError(f"unknown transliteration: {self.transliteration!r}")
+        if self.niggahita not in NIGGAHITA.values():
+            raise ValueError(f"unknown niggahīta conversion: {self.niggahita!r}")
+        if self.v_w not in V_W.values():
+            raise ValueError(f"unknown v ⇄ w conversion: {self.v_w!r}")
+
+    @property
+    def sepa(self) -> str:
+        """The juncture sign as it is inserted into the text."""
+        return " " + (self.juncture_sign or DEFAULT_JUNCTURE_SIGN) + " "
+
+
+def add_option_arguments(parser):
+    """Give an argparse parser one flag for every sidebar option."""
+    group = parser.add_argument_group("splitting options (as in the sidebar)")
+    group.add_argument("--sign", default=DEFAULT_JUNCTURE_SIGN, metavar="SIGN",
+                       help=f"juncture sign (default {DEFAULT_JUNCTURE_SIGN})")
+    group.add_argument("--show-punctuation", action="store_true", help="show hidden punctuation marks")
+    group.add_argument("--hide-hyphens", action="store_true", help="hide hyphens and apostrophes")
+    group.add_argument("--uppercase", action="store_true", help="split text in UPPERCASE")
+    group.add_argument("--samyoga", action="store_true", help="saṃyoga/continuous chanting style")
+    group.add_argument("--translit", choices=list(TRANSLITERATIONS.values()), default="none",
+                       help="convert transliteration standard")
+    group.add_argument("--nn", action="store_true", help="ññ → nñ")
+    group.add_argument("--ng", action="store_true", help="ṅ → ng")
+    group.add_argument("--niggahita", choices=list(NIGGAHITA.values()), default="none", help="ṃ, ṁ → ng or m")
+    group.add_argument("--v-w", choices=list(V_W.values()), default="none", help="v ⇄ w")
+    group.add_argument("--medial-nasal", action="store_true",
+                       help="medial anusvāra/niggahīta to nasal (gaṃgā → gaṅgā)")
+    return group
+
+
+def options_from_arguments(args) -> SplitOptions:
+    """The SplitOptions chosen with the flags of :func:`add_option_arguments`."""
+    return SplitOptions(
+        juncture_sign=args.sign,
+        show_punctuation=args.show_punctuation,
+        hide_hyphens=args.hide_hyphens,
+        uppercase=args.uppercase,
+        samyoga_pauses=args.samyoga,
+        transliteration=args.translit,
+        nasal_nn=args.nn,
+        nasal_ng=args.ng,
+        niggahita=args.niggahita,
+        v_w=args.v_w,
+        medial_nasal=args.medial_nasal,
+    )
+
+
+def options_from_dict(values: dict, defaults: SplitOptions = SplitOptions()) -> SplitOptions:
+    """``defaults`` with the fields in ``values`` (e.g. from JSON) replaced.
+
+    Raises ValueError for unknown fields and values.
+    """
+    if not isinstance(values, dict):
+        raise ValueError("options must be an object")
+    unknown = sorted(set(values) - {field.name for field in fields(SplitOptions)})
+    if unknown:
+        raise ValueError(f"unknown option: {', '.join(unknown)}")
+    return replace(defaults, **values)
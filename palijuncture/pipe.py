@@ -0,0 +1,178 @@
+"""Split a stream of JSON-lines records, for pipelines.
+
+Reads one JSON object per line from stdin and writes one per line to
+stdout::
+
+    {"id": 7, "text": "Evaṃ me sutaṃ", "options": {"uppercase": true}}
+    {"id": 7, "split": "E ― VAṂ ―  ...", "timings": {"queue_ms": 0.1, "split_ms": 0.4, "total_ms": 0.6}}
+
+``id`` is passed through as it is and ``options`` (optional) takes the
+field names of :class:`palijuncture.SplitOptions`, on top of the defaults
+given on the command line. A record that cannot be split is answered
+with ``{"id": ..., "error": "..."}`` and the stream goes on.
+
+The rules are compiled once at start-up. With ``--jobs`` above one,
+records are split in a pool of warm worker processes, and answers are
+written in input order (``--ordered``, the default) or as soon as each one
+is done (``--as-completed``). At most ``--max-pending`` records are read
+ahead of the last answer written, so a fast producer cannot fill memory.
+
+    python -m palijuncture.pipe --jobs 4 --as-completed < records.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import IO, Iterable, Optional
+
+from .options import SplitOptions, add_option_arguments, options_from_arguments, options_from_dict
+from .pool import start_pool, timed_split, warm
+
+DEFAULT_MAX_PENDING = 256
+
+
+def parse_record(line: str, defaults: SplitOptions):
+    """The id, text and options of one input line; raises ValueError if it is not a record."""
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"not JSON: {e}") from None
+    if not isinstance(record, dict):
+        raise ValueError("a record must be a JSON object")
+    record_id = record.get("id")
+    text = record.get("text")
+    if not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+    return record_id, text, options_from_dict(record.get("options") or {}, defaults)
+
+
+class _Writer:
+    """Writes answers, in order if asked, and frees a slot for each one."""
+
+    def __init__(self, out: IO[str], ordered: bool, slots: threading.Semaphore):
+        self.out = out
+        self.ordered = ordered
+        self.slots = slots
+        self._ready = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def put(self, seq: int, answer: dict):
+        with self._lock:
+            if not self.ordered:
+                self._write(answer)
+                return
+            self._ready[seq] = answer
+            while self._next in self._ready:
+                self._write(self._ready.pop(self._next))
+                self._next += 1
+
+    def _write(self, answer: dict):
+        self.out.write(json.dumps(answer, ensure_ascii=False) + "\n")
+        self.out.flush()
+        self.slots.release()
+
+
+def run(lines: Iterable[str], out: IO[str], defaults: Optional[SplitOptions] = None, workers: int = 1,
+        ordered: bool = True, max_pending: int = DEFAULT_MAX_PENDING) -> int:
+    """Answer every record in ``lines`` on ``out``; returns the number of records."""
+    if defaults is None:
+        defaults = SplitOptions()
+    slots = threading.Semaphore(max_pending)
+    writer = _Writer(out, ordered, slots)
+    pool = start_pool(workers, [defaults]) if workers > 1 else None
+    if pool is None:
+        warm([defaults])
+    seq = 0
+    try:
+        for line in lines:
+            if not line.strip():
+                continue
+            slots.acquire()
+            received = time.perf_counter()
+            try:
+                record_id, text, options = parse_record(line, defaults)
+            except ValueError as e:
+                record_id = _peek_id(line)
+                writer.put(seq, {"id": record_id, "error": str(e)})
+                seq += 1
+                continue
+            if pool is None:
+                try:
+                    answer = _answer(record_id, received, received, *timed_split(text, options))
+                except Exception as e:  # one bad record must not end the stream
+                    answer = {"id": record_id, "error": f"{type(e).__name__}: {e}"}
+                writer.put(seq, answer)
+            else:
+                future = pool.submit(timed_split, text, options)
+                future.add_done_callback(_on_done(writer, seq, record_id, received))
+            seq += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    return seq
+
+
+def _on_done(writer: _Writer, seq: int, record_id, received: float):
+    def done(future):
+        try:
+            split, split_ms = future.result()
+        except Exception as e:  # a dead worker must not stall the stream
+            writer.put(seq, {"id": record_id, "error": f"{type(e).__name__}: {e}"})
+            return
+        writer.put(seq, _answer(record_id, received, time.perf_counter() - split_ms / 1000, split, split_ms))
+    return done
+
+
+def _answer(record_id, received: float, started: float, split: str, split_ms: float) -> dict:
+    total_ms = (time.perf_counter() - received) * 1000
+    return {
+        "id": record_id,
+        "split": split,
+        "timings": {
+            "queue_ms": round(max(0.0, (started - received) * 1000), 3),
+            "split_ms": round(split_ms, 3),
+            "total_ms": round(total_ms, 3),
+        },
+    }
+
+
+def _peek_id(line: str):
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return record.get("id") if isinstance(record, dict) else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture.pipe", description=__doc__.split("\n\n")[0])
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes; 1 splits in this process, 0 uses one per CPU (default 1)")
+    order = parser.add_mutually_exclusive_group()
+    order.add_argument("--ordered", dest="ordered", action="store_true", default=True,
+                       help="write answers in input order (default)")
+    order.add_argument("--as-completed", dest="ordered", action="store_false",
+                       help="write each answer as soon as it is done")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help=f"records read ahead of the answers written (default {DEFAULT_MAX_PENDING})")
+    add_option_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        defaults = options_from_arguments(args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.max_pending < 1:
+        parser.error("--max-pending must be at least 1")
+    sys.stdin.reconfigure(encoding="utf-8")
+    sys.stdout.reconfigure(encoding="utf-8")
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    run(sys.stdin, sys.stdout, defaults, jobs, args.ordered, args.max_pending)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
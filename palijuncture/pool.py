@@ -0,0 +1,73 @@
+"""Split texts in worker processes that stay warm.
+
+Long-running front ends (the JSON-lines pipe, the HTTP service) send texts
+to a pool of processes. Each worker compiles the rules once when it
+starts and keeps its own cache of splits and lines, so a text costs one
+round trip and nothing else.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .cache import SplitCache
+from .engine import compile_plan, core_options
+from .memo import LineMemo
+from .options import SplitOptions
+
+# One per process
+_cache: Optional[SplitCache] = None
+
+
+def splitter() -> SplitCache:
+    """The cache this process splits through."""
+    global _cache
+    if _cache is None:
+        _cache = SplitCache(lines=LineMemo())
+    return _cache
+
+
+def warm(options_list: Iterable[SplitOptions] = ()):
+    """Compile the plans for ``options_list`` (and the defaults) ahead of the first text."""
+    compile_plan(SplitOptions())
+    for options in options_list:
+        compile_plan(options)
+    splitter()
+
+
+def timed_split(text: str, options: SplitOptions) -> Tuple[str, float]:
+    """The split text and the milliseconds it took."""
+    start = time.perf_counter()
+    split = splitter().split(text, options)
+    return split, (time.perf_counter() - start) * 1000
+
+
+def core_split(text: str, options: SplitOptions) -> str:
+    """The core split, through this process's line memo."""
+    return splitter().lines.split_core(text, options)
+
+
+def piece_cores(pieces: Sequence[str], options: SplitOptions) -> List[str]:
+    """The core splits of some :meth:`LineMemo.pieces`, through this process's line memo."""
+    return splitter().lines.split_pieces(pieces, core_options(options))
+
+
+def timed_splits(items: Sequence[Tuple[str, SplitOptions]]) -> List[Union[Tuple[str, float], Exception]]:
+    """:func:`timed_split` for a whole batch, in one round trip to a worker.
+
+    A text that fails gets its exception in place of its split, so it
+    does not take the rest of the batch with it.
+    """
+    results: List[Union[Tuple[str, float], Exception]] = []
+    for text, options in items:
+        try:
+            results.append(timed_split(text, options))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def start_pool(workers: int, options_list: Sequence[SplitOptions] = (), mp_context=None) -> ProcessPoolExecutor:
+    """A process pool whose workers are warmed up with ``options_list``."""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                               initializer=warm, initargs=(tuple(options_list),))
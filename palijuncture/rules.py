@@ -0,0 +1,372 @@
+"""The juncture-splitting rules.
+
+Every rule is an ``(old, new)`` pair for ``str.replace``; the stages are
+listed in the exact order the original replace chain applied them. ``J``
+stands for the juncture sign with its spaces. The sign itself is a
+private-use character while the text is split, so the same compiled rules
+serve every juncture sign and a custom sign can never be mistaken for a
+hyphen, a period or anything else in the text.
+
+A few rules look wrong (``ā―ṇ―`` becoming ``āṅ―``, ``ĀY―Y`` left as it
+is, the skipped line-initial clusters) but they are what the page has
+always produced, so they are kept as they are, marked with "(sic)".
+
+Case variants are spelled out rather than matched on a case-folded copy
+of the text. The casing rules are not symmetric: capitals are only split
+with the UPPERCASE option, TitleCase long vowels only before a consonant
+and a vowel, and some clusters are only rejoined after a space or a line
+break in one case. Folding the case would change the output of mixed-case
+texts. The engine already merges the case variants of a rule into the
+same pass, so they add rules to a regex but hardly any passes.
+"""
+
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from .options import SplitOptions
+
+# Stands in for the juncture sign until the split text is rendered
+JUNCTURE = "\ue000"
+J = " " + JUNCTURE + " "
+
+Rule = Tuple[str, str]
+
+
+class Stage(NamedTuple):
+    name: str
+    rules: Tuple[Rule, ...]
+    # Run the stage only if this returns True for the options
+    when: Optional[Callable[[SplitOptions], bool]] = None
+
+
+# Special steps that are not plain replacements
+FIRST_LETTERS = "first_letters"
+END_OF_TEXT = "end_of_text"
+
+
+def _upper(rules):
+    return tuple((old.upper(), new.upper()) for old, new in rules)
+
+
+def _uppercase(options):
+    return options.uppercase
+
+
+LONG_VOWELS = ("ā", "ī", "ū", "e", "o")
+LONG_VOWELS_UPPER = ("Ā", "Ī", "Ū", "E", "O")
+VOWELS = ("a", "ā", "i", "ī", "u", "ū", "e", "o")
+CONSONANTS = (
+    "k", "kh", "g", "gh", "ṅ",
+    "c", "ch", "j", "jh", "ñ",
+    "ṭ", "ṭh", "ḍ", "ḍh", "ṇ",
+    "t", "th", "d", "dh", "n",
+    "p", "ph", "b", "bh", "m",
+    "r", "l", "ḷ", "y", "v", "s", "h",
+)
+# 1st, 3rd and 5th vaggas (unaspirated and nasals)
+DOUBLE_CONSONANTS = (
+    "kk", "gg", "ṅṅ", "ṅk", "ṅg",
+    "cc", "jj", "ññ", "ñc", "ñj",
+    "ṭṭ", "ḍḍ", "ṇṇ", "ṇṭ", "ṇḍ",
+    "tt", "dd", "nn", "nt", "nd",
+    "pp", "bb", "mm", "mp", "mb",
+)
+# Pauses: comma, period, ellipsis, question mark, exclamation mark,
+# semi-colon, colon, em dash, en dash and line break
+M_PAUSES = (" ", ",", " ,", ".", "…", "?", "!", ";", ":", "—", " —", "–", " –", "\n")
+M_CONSONANTS = ("k", "K", "g", "G", "c", "C", "j", "J", "ṭ", "Ṭ", "ḍ", "Ḍ", "t", "T", "d", "D", "y", "Y", "s", "S")
+SHORT_VOWEL_PAUSES = ("  \n", "  ", ",", " ,", ".", "…", "?", "!", "—", " —", "–", " –", ";", ":")
+
+# Abbreviations in SuttaCentral info boxes, hidden from the rules and
+# restored at the end
+ABBREVIATIONS = (
+    ("pts1ed", "Α"),
+    ("Variant:", "Β"),
+    ("bj,", "Γ"),
+    ("sya-all,", "Ζ"),
+    ("sya-all", "Δ"),
+    (" km", "Ε"),
+)
+
+
+def _tv_clusters(first, second, v):
+    """tv, dv, yv, sv and rv between vowels, in one combination of cases."""
+    def case(letters, upper):
+        return letters.upper() if upper else letters
+    # atv, itv, utv, odv, ...; the etv, ātv and ūtv rules were never reached
+    clusters = ("at", "it", "ut", "od", "ad", "id", "ay", "as", "is", "īs",
+                "ar", "ir", "ur", "er", "or", "ār", "īr", "ūr")
+    split_vowels = ("et", "āt", "ūt", "od", "īs", "er", "ār", "ūr", "or", "īr")
+    rules = []
+    for vowel, consonant in clusters:
+        vowel, consonant = case(vowel, first), case(consonant, second)
+        rules.append((vowel + consonant + v, vowel + consonant + J + v))
+    for vowel, consonant in split_vowels:
+        vowel, consonant = case(vowel, first), case(consonant, second)
+        rules.append((vowel + J + consonant + v, vowel + consonant + J + v))
+    return tuple(rules)
+
+
+def _rejoin_long_vowel(followers, vowels=LONG_VOWELS):
+    """Remove the juncture sign after a long vowel that is followed by a
+    consonant cluster, since the cluster already gets its own."""
+    return tuple(
+        (vowel + J + consonant + J + rest, vowel + consonant + J + rest)
+        for consonant, rest in followers
+        for vowel in vowels
+    )
+
+
+DOUBLE_REJOINS = tuple(
+    (vowel + J + consonant + J, vowel + ("ṅ" if consonant == "ṇ" else consonant) + J)  # (sic) ṇ → ṅ
+    for vowel in LONG_VOWELS
+    for consonant in ("k", "g", "ṅ", "c", "j", "ñ", "ṭ", "ḍ", "ṇ", "t", "d", "n", "p", "b", "m")
+)
+Y_REJOINS = _rejoin_long_vowel([(c, "y") for c in ("k", "m", "y", "l", "v")])
+Y_REJOINS_UPPER = tuple(
+    # (sic) the Y⁠―⁠Y rules lost their juncture sign and change nothing
+    (old, new) if not old[1:].startswith(J + "Y") else (old.replace(J, "", 1), new)
+    for old, new in _upper(Y_REJOINS)
+)
+
+# Onsets that take no juncture sign at the start of a word
+ONSETS = ("hm", "sm", "cc", "jj", "ṭṭ", "tt",
+          "ñh", "ṇh", "nh", "mh", "yh", "ḷh", "lh", "vh",
+          "ky", "my", "yy", "ly", "vy", "ty", "dy",
+          "ll", "ms", "ss")
+ONSETS_H = ONSETS[:14]
+ONSETS_Y = ONSETS[14:]
+
+
+def _onsets(prefix, onsets, title=False, upper=False):
+    rules = []
+    for onset in onsets:
+        if upper:
+            onset = onset.upper()
+        elif title:
+            onset = onset[0].upper() + onset[1:]
+        rules.append((prefix + onset[0] + J + onset[1], prefix + onset))
+    return tuple(rules)
+
+
+# Line-initial clusters whose juncture sign is removed again when the text
+# starts with them. Only the first occurrence is touched.
+FIRST_LETTER_ONSETS = tuple(
+    onset
+    for pair in ("ñh", "ṇh", "nh", "mh", "yh", "ḷh", "lh", "vh",
+                 "ky", "ly", "my", "vy", "ty", "dy", "yy",
+                 "hm", "sm", "ll", "ms", "ss")
+    for onset in (pair, pair[0] + pair[1].upper(), pair.upper())
+)
+
+NASALS = (("ṅ", "g"), ("ṅ", "k"), ("ñ", "j"), ("ñ", "c"), ("ṇ", "ṭ"),
+          ("ṇ", "ḍ"), ("n", "t"), ("n", "d"), ("m", "p"), ("m", "b"))
+PUNCTUATION_PAUSES = (",", " ,", ".", "?", "!", "—", " —", "–", " –", ";", ":", "…")
+
+CORE_STAGES = (
+    Stage("abbreviations", ABBREVIATIONS),
+    # Fix line breaks to double whitespaces and line breaks
+    Stage("line_breaks", (("\n", "  \n"),)),
+    # Remove circumflex in Â, â, Î, î, Û, û, Ê, ê, Ô, ô
+    Stage("circumflex", (("Â", "Ā"), ("â", "ā"), ("Î", "Ī"), ("î", "ī"), ("Û", "Ū"),
+                         ("û", "ū"), ("Ê", "E"), ("ê", "e"), ("Ô", "O"), ("ô", "o"))),
+    # Convert m to ṃ when followed by a pause or a consonant
+    Stage("m_to_niggahita", tuple(
+        (m + follower, ṃ + follower)
+        for follower in M_PAUSES + M_CONSONANTS
+        for m, ṃ in (("m", "ṃ"), ("M", "Ṃ"))
+    )),
+    # Insert juncture sign after long vowels (ā, ī, ū, e, o)
+    Stage("long_vowels", tuple((v, v + J) for v in LONG_VOWELS)),
+    Stage("long_vowels_titlecase", tuple(
+        (vowel + consonant + short, vowel + J + consonant + short)
+        for short in VOWELS
+        for vowel in LONG_VOWELS_UPPER
+        for consonant in CONSONANTS
+    )),
+    Stage("long_vowels_upper", tuple((v, v + J) for v in LONG_VOWELS_UPPER), _uppercase),
+    # Insert juncture sign after the letter m followed by a space
+    Stage("m_space", (("m ", "m " + J),)),
+    Stage("m_space_upper", (("M ", "M " + J),), _uppercase),
+    # Insert juncture sign inbetween double consonants
+    Stage("double_consonants", tuple((cc, cc[0] + J + cc[1]) for cc in DOUBLE_CONSONANTS)),
+    Stage("double_consonants_upper", _upper((cc, cc[0] + J + cc[1]) for cc in DOUBLE_CONSONANTS), _uppercase),
+    # Insert juncture sign after the letters ṃ and ṁ
+    Stage("niggahita", (("ṃ", "ṃ" + J),)),
+    Stage("niggahita_upper", (("Ṃ", "Ṃ" + J),), _uppercase),
+    Stage("niggahita_dot_above", (("ṁ", "ṁ" + J),)),
+    Stage("niggahita_dot_above_upper", (("Ṁ", "Ṁ" + J),), _uppercase),
+    # Insert juncture sign after h and s before m; after ñ, ṇ, n, m, y, ḷ, l
+    # and v before h; after k, m, y, l and v before y; inbetween ll; after
+    # m and s before s
+    Stage("h_s_m", (("hm", "h" + J + "m"), ("sm", "s" + J + "m"))),
+    Stage("h_s_m_upper", (("HM", "H" + J + "M"), ("SM", "S" + J + "M")), _uppercase),
+    Stage("before_h", tuple((c + "h", c + J + "h") for c in ("ñ", "ṇ", "n", "m", "y", "ḷ", "l", "v"))),
+    Stage("before_h_upper", tuple((c + "H", c + J + "H") for c in ("Ñ", "Ṇ", "N", "M", "Y", "Ḷ", "L", "V")), _uppercase),
+    Stage("before_y", tuple((c + "y", c + J + "y") for c in ("k", "m", "y", "l", "v"))),
+    Stage("before_y_upper", tuple((c + "Y", c + J + "Y") for c in ("K", "M", "Y", "L", "V")), _uppercase),
+    Stage("l_l", (("ll", "l" + J + "l"),)),
+    Stage("l_l_upper", (("LL", "L" + J + "L"),), _uppercase),
+    Stage("before_s", (("ms", "m" + J + "s"), ("ss", "s" + J + "s"))),
+    Stage("before_s_upper", (("MS", "M" + J + "S"), ("SS", "S" + J + "S")), _uppercase),
+    # Insert juncture sign between tv, dv, yv, sv, rv if preceded by a vowel
+    Stage("before_v",
+          _tv_clusters(False, False, "v")
+          + _tv_clusters(True, True, "v")
+          + _tv_clusters(True, False, "v")
+          + _tv_clusters(True, False, "V")
+          + _tv_clusters(False, False, "V")
+          + _tv_clusters(False, True, "V")),
+    Stage("before_v_upper", _tv_clusters(True, True, "V"), _uppercase),
+    # Remove juncture sign after long vowels followed by a consonant cluster
+    # or by ṃ / ṁ
+    Stage("rejoin_double_consonants", DOUBLE_REJOINS),
+    Stage("rejoin_double_consonants_upper", _upper(DOUBLE_REJOINS), _uppercase),
+    Stage("rejoin_niggahita", tuple((v + J + n, v + n) for n in ("ṃ", "ṁ") for v in LONG_VOWELS)),
+    Stage("rejoin_niggahita_upper", tuple((v + J + n, v + n) for n in ("Ṃ", "Ṁ") for v in LONG_VOWELS_UPPER), _uppercase),
+    Stage("rejoin_h_s_m", _rejoin_long_vowel([("h", "m"), ("s", "m")])),
+    Stage("rejoin_h_s_m_upper", _upper(_rejoin_long_vowel([("h", "m"), ("s", "m")])), _uppercase),
+    Stage("rejoin_before_h", _rejoin_long_vowel([(c, "h") for c in ("ñ", "ṇ", "n", "m", "y", "ḷ", "l", "v")])),
+    Stage("rejoin_before_h_upper", _upper(_rejoin_long_vowel([(c, "h") for c in ("ñ", "ṇ", "n", "m", "y", "ḷ", "l", "v")])), _uppercase),
+    Stage("rejoin_before_y", Y_REJOINS),
+    Stage("rejoin_before_y_upper", Y_REJOINS_UPPER, _uppercase),
+    Stage("rejoin_l_l", _rejoin_long_vowel([("l", "l")])),
+    Stage("rejoin_l_l_upper", _upper(_rejoin_long_vowel([("l", "l")])), _uppercase),
+    Stage("rejoin_before_s", _rejoin_long_vowel([("m", "s"), ("s", "s")])),
+    Stage("rejoin_before_s_upper", _upper(_rejoin_long_vowel([("m", "s"), ("s", "s")])), _uppercase),
+    # Remove juncture sign after ṅ_k followed by y
+    Stage("ṅky", tuple(
+        (n + J + k + J + y, n + J + k + y)
+        for n, k, y in (("ṅ", "k", "y"), ("Ṅ", "k", "y"), ("Ṅ", "K", "y"), ("Ṅ", "k", "Y"),
+                        ("ṅ", "K", "Y"), ("ṅ", "k", "Y"), ("ṅ", "K", "y"))
+    )),
+    Stage("ṅky_upper", (("Ṅ" + J + "K" + J + "Y", "Ṅ" + J + "K" + "Y"),), _uppercase),
+    # Insert juncture sign between kl if kl occurs between vowels
+    Stage("kl", tuple((a + "kl" + b, a + "k" + J + "l" + b) for a in VOWELS for b in VOWELS)),
+    Stage("kl_upper", _upper((a + "kl" + b, a + "k" + J + "l" + b) for a in VOWELS for b in VOWELS), _uppercase),
+    # Remove juncture sign in certain clusters if the syllable begins with a
+    # capital letter, or is preceded by a space or a line break
+    Stage("onsets",
+          _onsets("", ONSETS, title=True)
+          + _onsets(" ", ONSETS_H)  # (sic) no " ky" … " ss"
+          + _onsets("\n", ONSETS_Y)  # (sic) no "\nhm" … "\nvh"
+          + _onsets(" ", ONSETS, upper=True)
+          + _onsets("\n", ONSETS, upper=True)),
+    # Remove double juncture signs
+    Stage("double_junctures", ((J + J, J), (J + J, J))),
+    # Fix the position of preposition pauses and junctions signs
+    Stage("pause_position", (
+        (J + ",", "," + J), (J + " ,", " ," + J), (J + ".", "." + J), (J + ".", "." + J),
+        (J + "….", "…." + J), (J + "…", "…" + J), (J + "?", "?" + J), (J + "!", "!" + J),
+        (J + "—", "—" + J), (J + " —", " —" + J), (J + "–", "–" + J), (J + " –", " –" + J),
+        (J + ";", ";" + J), (J + ":", ":" + J),
+    )),
+    # Breaks for short open syllables at the end of a phrase/sentence
+    Stage("short_vowel_pauses", tuple(
+        (v + pause, v + J + pause if pause.startswith("  ") else v + pause + J)
+        for pause in SHORT_VOWEL_PAUSES
+        for v in ("a", "i", "u")
+    )),
+    Stage("short_vowel_pauses_upper", tuple(
+        (v + pause, v + J + pause if pause.startswith("  ") else v + pause + J)
+        for pause in SHORT_VOWEL_PAUSES
+        for v in ("A", "I", "U")
+    ), _uppercase),
+    # (Optional) Saṃyoga pauses: no breaks for short open syllables
+    Stage("samyoga_pauses", tuple(
+        (v + J + pause if pause.startswith("  ") else v + pause + J, v + pause)
+        for vowels in (("a", "i", "u"), ("A", "I", "U"))
+        for pause in SHORT_VOWEL_PAUSES
+        for v in vowels
+    ), lambda o: o.samyoga_pauses),
+    # (Optional) Medial anusvāra / niggahīta to nasal (gaṃgā → gaṅgā)
+    Stage("medial_nasal", tuple(
+        rule
+        for nasal, consonant in NASALS
+        for junction in ("", J)
+        for rule in (
+            ("ṃ" + junction + consonant, nasal + junction + consonant),
+            ("ṁ" + junction + consonant, nasal + junction + consonant),
+            ("Ṃ" + junction + consonant.upper(), nasal.upper() + junction + consonant.upper()),
+            ("Ṁ" + junction + consonant.upper(), nasal.upper() + junction + consonant.upper()),
+        )
+    ), lambda o: o.medial_nasal),
+)
+
+# The options the core stages above depend on. Everything below only
+# changes how the split text is shown, and is cheap to run again on a
+# cached core split.
+CORE_OPTIONS = ("uppercase", "samyoga_pauses", "medial_nasal")
+
+OUTPUT_STAGES = (
+    # Nasal ññ → nñ
+    Stage("nasal_nn", (
+        ("ñ" + J + "ñ", "n" + J + "ñ"), ("Ñ" + J + "Ñ", "N" + J + "Ñ"),
+        ("Ñ" + J + "ñ", "N" + J + "ñ"), ("ñ" + J + "Ñ", "n" + J + "Ñ"),
+    ), lambda o: o.nasal_nn),
+    # Nasal ṅ → ng
+    Stage("nasal_ng", (("ṅ", "ng"),), lambda o: o.nasal_ng),
+    Stage("nasal_ng_upper", (("Ṅ", "NG"),), lambda o: o.nasal_ng and o.uppercase),
+    # ṃ, ṁ → ng or m
+    Stage("niggahita_ng", (("ṃ", "ng"), ("ṁ", "ng")), lambda o: o.niggahita == "ng"),
+    Stage("niggahita_ng_upper", (("Ṃ", "NG"), ("Ṁ", "NG")), lambda o: o.niggahita == "ng" and o.uppercase),
+    Stage("niggahita_m", (("ṃ", "m"), ("ṁ", "m")), lambda o: o.niggahita == "m"),
+    Stage("niggahita_m_upper", (("Ṃ", "M"), ("Ṁ", "M")), lambda o: o.niggahita == "m" and o.uppercase),
+    FIRST_LETTERS,
+    # Replace 'v' with 'w' if preceded by a consonant in the same syllable
+    # Frankfurter, O. (1883). Handbook of Pali. United Kingdom: Williams and Norgate.
+    Stage("v_to_w_conjunct", tuple(
+        (c + v, c + w)
+        for consonant in ("t", "d", "y", "s")
+        for c, v, w in ((consonant, "v", "w"), (consonant.upper(), "v", "w"),
+                        (consonant, "V", "W"), (consonant.upper(), "V", "W"))
+    ), lambda o: o.v_w == "conjunct"),
+    Stage("v_to_w", (("v", "w"), ("V", "W")), lambda o: o.v_w == "v_to_w"),
+    Stage("w_to_v", (("w", "v"), ("W", "V")), lambda o: o.v_w == "w_to_v"),
+    # Extra juncture sign after pause-indicating punctuation and at the end of lines
+    Stage("punctuation_pauses", tuple(
+        rule
+        for mark in PUNCTUATION_PAUSES
+        for rule in ((mark, mark + J), (mark + J + J + J, mark + J + J))
+    ) + tuple((v + J + "  ", v + J + J + "  ") for v in ("a", "i", "u", "e", "o", "ā", "ī", "ū", "ṃ", "ṁ")),
+        lambda o: not o.samyoga_pauses),
+    Stage("punctuation_pauses_upper", tuple(
+        (v + J + "  ", v + J + J + "  ") for v in ("A", "I", "U", "E", "O", "Ā", "Ī", "Ū", "Ṃ", "Ṁ")
+    ), lambda o: not o.samyoga_pauses and o.uppercase),
+    # Convert period to period-like symbol "․" for numbering
+    Stage("numbering", tuple((d + "." + J, d + "․") for d in "1234567890")),
+    # Hide punctuation marks
+    Stage("hide_punctuation", tuple(
+        (mark, "") for mark in (",", ".", "…", "¶", "?", "!", "—", "–", ";", ":", "“", "‘", "”", "’", "\"", "'")
+    ), lambda o: not o.show_punctuation),
+    # Hide hyphens and apostrophes
+    Stage("hide_hyphens", (
+        # (sic) "- " is never hidden on its own
+        (" - ", ""), (" -", ""), ("-", ""), (" ' ", ""), (" '", ""), ("' ", ""), ("'", ""),
+    ), lambda o: o.hide_hyphens),
+    # Fix period and juncture sign position; fix end quotes' position with juncture sign
+    Stage("quote_position", ((J + ".", "." + J),) + tuple(
+        rule
+        for quote in ("’’", "”", "’", "''", "\"", "'")
+        for rule in ((J + J + quote, quote + J + J), (J + quote, quote + J))
+    )),
+    # Transliteration standard conversion
+    Stage("iast", (("ṁ", "ṃ"), ("Ṁ", "Ṃ")), lambda o: o.transliteration == "iast"),
+    Stage("iso", (("ṃ", "ṁ"), ("Ṃ", "Ṁ")), lambda o: o.transliteration == "iso"),
+    Stage("velthuis", (
+        ("ṃ", ".m"), ("ṁ", ".m"), ("ā", "aa"), ("ī", "ii"), ("ū", "uu"), ("ṅ", "\"n"),
+        ("ñ", "\\~n"), ("ṭ", ".t"), ("ḍ", ".d"), ("ṇ", ".n"), ("ś", "“s"), ("ṣ", ".s"), ("ḷ", ".l"),
+        ("Ṃ", ".M"), ("Ā", "AA"), ("Ī", "II"), ("Ū", "UU"), ("Ṅ", "\"N"), ("Ñ", "\\~N"),
+        ("Ṭ", ".T"), ("Ḍ", ".D"), ("Ṇ", ".N"), ("Ś", "“S"), ("Ṣ", ".S"), ("Ḷ", ".L"), ("Ṁ", ".M"),
+    ), lambda o: o.transliteration == "velthuis"),
+    # Double juncture signs at the end of the text
+    END_OF_TEXT,
+    # Convert period-like symbol "․" back to period for numbering
+    Stage("numbering_restore", tuple((d + "․", d + ".") for d in "1234567890")),
+    # Decrypt SuttaCentral abbreviations in info box
+    Stage("abbreviations_restore", (
+        ("Α", "pts1ed"), ("Β", "🔍Variant:"), ("Γ", "bj,"), ("Ζ", "sya-all,"), ("Δ", "sya-all"), ("Ε", " km"),
+    )),
+    Stage("final_cleanup", ((J + " ….", " …." + J), (J + " …", " …" + J), (J + J + J, J + J))),
+)
+
+STAGES = CORE_STAGES + OUTPUT_STAGES
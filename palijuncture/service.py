@@ -0,0 +1,339 @@
+"""A small HTTP service around the splitter, on the standard library only.
+
+    python -m palijuncture.service --port 8765 --jobs 4
+
+Endpoints, all JSON:
+
+``POST /split``
+    ``{"text": ..., "options": {...}}`` → ``{"split": ..., "timings": {...}}``
+``POST /split/batch``
+    ``{"items": [{"id": ..., "text": ..., "options": {...}}, ...], "options": {...}}``
+    → ``{"results": [{"id": ..., "split": ...}, ...]}``; the outer
+    ``options`` are the defaults for every item, and an item that fails
+    to split gets ``{"id": ..., "error": ...}`` instead.
+``GET /stats``
+    request counts, latency percentiles and batch sizes.
+
+``options`` take the field names of :class:`palijuncture.SplitOptions`.
+An asyncio front end reads the requests; texts that arrive within
+``--batch-wait`` milliseconds of each other are sent together to a pool
+of warm worker processes, so many small requests cost few round trips.
+The service is meant for localhost and trusted callers: there is no
+authentication and request bodies are capped at ``--max-body`` bytes.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .options import SplitOptions, add_option_arguments, options_from_arguments, options_from_dict
+from .pool import start_pool, timed_splits
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 64
+DEFAULT_BATCH_WAIT_MS = 2.0
+DEFAULT_MAX_BODY = 8 * 2 ** 20
+# What is read of a refused request before the connection is closed
+DISCARD_LIMIT = 2 ** 20
+DISCARD_SECONDS = 1.0
+# Latencies kept for the percentiles
+LATENCY_WINDOW = 10_000
+
+ROUTES = {"/split": "POST", "/split/batch": "POST", "/stats": "GET"}
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def percentiles(values, points=(50, 90, 99)) -> Dict[str, float]:
+    """Nearest-rank percentiles of ``values``, plus the maximum."""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    result = {f"p{p}": round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 3) for p in points}
+    result["max"] = round(ordered[-1], 3)
+    return result
+
+
+class Batcher:
+    """Coalesces texts from concurrent requests into batches for the pool."""
+
+    def __init__(self, pool, max_batch: int = DEFAULT_MAX_BATCH, wait_ms: float = DEFAULT_BATCH_WAIT_MS):
+        self.pool = pool
+        self.max_batch = max_batch
+        self.wait = wait_ms / 1000
+        self._items: List[Tuple[str, SplitOptions, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.batch_sizes: Deque[int] = deque(maxlen=LATENCY_WINDOW)
+
+    async def split(self, text: str, options: SplitOptions) -> Tuple[str, float]:
+        """The split text and the milliseconds the worker took for it."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append((text, options, future))
+        if len(self._items) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._items = self._items, []
+        if not items:
+            return
+        self.batch_sizes.append(len(items))
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(self.pool, timed_splits, [(text, options) for text, options, _ in items])
+        work.add_done_callback(lambda done: self._deliver(items, done))
+
+    @staticmethod
+    def _deliver(items, done: asyncio.Future):
+        error = done.exception()
+        for i, (_, _, future) in enumerate(items):
+            if future.done():  # the client went away
+                continue
+            result = error if error is not None else done.result()[i]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class Service:
+    """The request handlers, and the numbers behind ``/stats``."""
+
+    def __init__(self, batcher: Batcher, defaults: Optional[SplitOptions] = None,
+                 max_body: int = DEFAULT_MAX_BODY):
+        self.batcher = batcher
+        self.defaults = defaults or SplitOptions()
+        self.max_body = max_body
+        self.started = time.time()
+        self.requests: Dict[str, int] = {}
+        self.errors = 0
+        self.latencies: Dict[str, Deque[float]] = {}
+
+    async def split(self, body: dict) -> dict:
+        text, options = self._item(body, self.defaults)
+        split, split_ms = await self.batcher.split(text, options)
+        return {"split": split, "timings": {"split_ms": round(split_ms, 3)}}
+
+    async def split_batch(self, body: dict) -> dict:
+        items = body.get("items")
+        if not isinstance(items, list):
+            raise HTTPError(400, "'items' must be a list")
+        defaults = self._options(body.get("options"), self.defaults)
+        parsed = []
+        for item in items:
+            if not isinstance(item, dict):
+                raise HTTPError(400, "every item must be an object")
+            parsed.append((item.get("id"),) + self._item(item, defaults))
+        splits = await asyncio.gather(*(self.batcher.split(text, options) for _, text, options in parsed),
+                                      return_exceptions=True)
+        results = []
+        for (item_id, _, _), split in zip(parsed, splits):
+            if isinstance(split, BaseException):
+                results.append({"id": item_id, "error": f"{type(split).__name__}: {split}"})
+            else:
+                results.append({"id": item_id, "split": split[0], "timings": {"split_ms": round(split[1], 3)}})
+        return {"results": results}
+
+    def stats(self) -> dict:
+        sizes = self.batcher.batch_sizes
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "latency_ms": {path: percentiles(values) for path, values in self.latencies.items()},
+            "batches": {"count": len(sizes), "mean_size": round(sum(sizes) / len(sizes), 2) if sizes else 0.0},
+        }
+
+    def _item(self, body: dict, defaults: SplitOptions) -> Tuple[str, SplitOptions]:
+        text = body.get("text")
+        if not isinstance(text, str):
+            raise HTTPError(400, "'text' must be a string")
+        return text, self._options(body.get("options"), defaults)
+
+    @staticmethod
+    def _options(values, defaults: SplitOptions) -> SplitOptions:
+        try:
+            return options_from_dict(values or {}, defaults)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+
+    async def respond(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if path not in ROUTES:
+            raise HTTPError(404, f"no such endpoint: {path}")
+        if method != ROUTES[path]:
+            raise HTTPError(405, f"use {ROUTES[path]} for {path}")
+        if path == "/stats":
+            return 200, self.stats()
+        try:
+            request = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HTTPError(400, f"not JSON: {e}") from None
+        if not isinstance(request, dict):
+            raise HTTPError(400, "the body must be a JSON object")
+        handler = self.split if path == "/split" else self.split_batch
+        return 200, await handler(request)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one connection, keeping it open between requests."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    await self._write(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await self._discard(reader, writer)
+                    return
+                if request is None:
+                    return
+                method, path, body, keep_alive = request
+                start = time.perf_counter()
+                try:
+                    status, answer = await self.respond(method, path, body)
+                except HTTPError as e:
+                    status, answer = e.status, {"error": str(e)}
+                except Exception as e:  # keep serving other requests
+                    status, answer = 500, {"error": f"{type(e).__name__}: {e}"}
+                self._record(path, status, (time.perf_counter() - start) * 1000)
+                await self._write(writer, status, answer, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _record(self, path: str, status: int, elapsed_ms: float):
+        if path not in ROUTES:
+            path = "other"
+        self.requests[path] = self.requests.get(path, 0) + 1
+        if status != 200:
+            self.errors += 1
+        elif path != "/stats":
+            self.latencies.setdefault(path, deque(maxlen=LATENCY_WINDOW)).append(elapsed_ms)
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        line = await self._readline(reader, 400, "request line too long")
+        if not line.strip():
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "malformed request line") from None
+        headers = {}
+        while True:
+            line = await self._readline(reader, 431, "header line too long")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "bad Content-Length") from None
+        if length < 0:
+            raise HTTPError(400, "bad Content-Length")
+        if length > self.max_body:
+            raise HTTPError(413, f"bodies are limited to {self.max_body} bytes")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+        return method.upper(), target.split("?", 1)[0], body, keep_alive
+
+    @staticmethod
+    async def _readline(reader: asyncio.StreamReader, status: int, message: str) -> bytes:
+        try:
+            return await reader.readline()
+        except ValueError:  # longer than the reader's limit
+            raise HTTPError(status, message) from None
+
+    @staticmethod
+    async def _discard(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read what is left of a refused request.
+
+        Closing while the client is still sending resets the connection,
+        and the client may never see the answer.
+        """
+        if writer.can_write_eof():
+            writer.write_eof()
+        left = DISCARD_LIMIT
+        try:
+            while left > 0:
+                data = await asyncio.wait_for(reader.read(left), DISCARD_SECONDS)
+                if not data:
+                    return
+                left -= len(data)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, answer: dict, keep_alive: bool):
+        body = json.dumps(answer, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(host: str = "127.0.0.1", port: int = DEFAULT_PORT, workers: int = 1,
+                defaults: Optional[SplitOptions] = None, max_batch: int = DEFAULT_MAX_BATCH,
+                batch_wait_ms: float = DEFAULT_BATCH_WAIT_MS, max_body: int = DEFAULT_MAX_BODY):
+    defaults = defaults or SplitOptions()
+    pool = start_pool(workers, [defaults])
+    try:
+        service = Service(Batcher(pool, max_batch, batch_wait_ms), defaults, max_body)
+        server = await asyncio.start_server(service.handle, host, port)
+        try:  # stop cleanly, with the workers, when terminated
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except NotImplementedError:
+            pass
+        print(f"splitting on http://{host}:{port} with {workers} workers", file=sys.stderr, flush=True)
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture.service", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="most texts sent to a worker at once")
+    parser.add_argument("--batch-wait", type=float, default=DEFAULT_BATCH_WAIT_MS, metavar="MS",
+                        help="how long a text waits for others to batch with")
+    parser.add_argument("--max-body", type=int, default=DEFAULT_MAX_BODY, metavar="BYTES")
+    add_option_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        defaults = options_from_arguments(args)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args.host, args.port, max(1, args.jobs), defaults,
+                          args.max_batch, args.batch_wait, args.max_body))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
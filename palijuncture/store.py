@@ -0,0 +1,200 @@
+"""A persistent dictionary of line splits in an sqlite file.
+
+The dictionary maps a line (with its line breaks, as :class:`LineMemo`
+splits it) to its core split, for every combination of core options it
+was built for. Each row carries a fingerprint of the core plan compiled
+for its options: the rules and which of them those options turn on. So
+changing a rule, or the option that enables a stage, simply makes the old
+rows invisible; ``prune`` deletes them.
+
+Build one from a corpus with::
+
+    python -m palijuncture.store build lines.sqlite corpus/*.txt
+
+and point the page at it with the ``PALIJUNCTURE_STORE`` environment
+variable.
+"""
+
+import argparse
+import hashlib
+import itertools
+import sqlite3
+import sys
+import threading
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
+
+from .engine import core_options, core_plan, split_core
+from .options import SplitOptions
+from .rules import CORE_OPTIONS, END_OF_TEXT, FIRST_LETTERS
+
+# Bump when the way pieces are keyed or stored changes
+STORE_FORMAT = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lines (
+    fingerprint TEXT NOT NULL,
+    options TEXT NOT NULL,
+    piece TEXT NOT NULL,
+    core TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, options, piece)
+) WITHOUT ROWID
+"""
+
+
+def rules_fingerprint(options: SplitOptions) -> str:
+    """A hash of the core rules run with ``options``, in order.
+
+    It changes whenever one of those rules does, and when a stage is
+    turned on or off by other options than before.
+    """
+    return _fingerprint(core_options(options))
+
+
+@lru_cache(maxsize=None)
+def _fingerprint(options: SplitOptions) -> str:
+    digest = hashlib.sha256(str(STORE_FORMAT).encode())
+    for step in core_plan(options):
+        # Rule by rule: how the rules are batched into steps does not change the split
+        for rule in (step.kind,) if step.kind in (FIRST_LETTERS, END_OF_TEXT) else step.rules:
+            digest.update(repr(rule).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def options_key(options: SplitOptions) -> str:
+    """The core option flags as stored, e.g. ``"uppercase=0,samyoga_pauses=1,medial_nasal=0"``."""
+    options = core_options(options)
+    return ",".join(f"{name}={int(getattr(options, name))}" for name in CORE_OPTIONS)
+
+
+class SplitStore:
+    """Read-through dictionary of line splits backed by sqlite.
+
+    Safe to share between threads. With ``readonly`` set, lines that are
+    not in the file are split but not written back, and a file that is
+    missing or has no ``lines`` table raises :class:`sqlite3.Error` here
+    rather than on every lookup.
+    """
+
+    def __init__(self, path: str, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        if readonly:
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            try:
+                self._db.execute("SELECT fingerprint, options, piece, core FROM lines LIMIT 1").fetchall()
+            except sqlite3.Error:
+                self._db.close()
+                raise
+        else:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(SCHEMA)
+            self._db.commit()
+        self._lock = threading.Lock()
+
+    def get(self, piece: str, options: SplitOptions) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT core FROM lines WHERE fingerprint = ? AND options = ? AND piece = ?",
+                (rules_fingerprint(options), options_key(options), piece),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, piece: str, core: str, options: SplitOptions):
+        if self.readonly:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO lines VALUES (?, ?, ?, ?)",
+                (rules_fingerprint(options), options_key(options), piece, core),
+            )
+            self._db.commit()
+
+    def build(self, texts: Iterable[str], options_list: Sequence[SplitOptions]) -> int:
+        """Add every distinct line of ``texts``; returns the number of new rows."""
+        from .memo import LineMemo
+
+        pieces = set()
+        for text in texts:
+            pieces.update(LineMemo.pieces(text))
+        keys = [(options, rules_fingerprint(options), options_key(options)) for options in options_list]
+        added = 0
+        with self._lock:
+            for options, fingerprint, key in keys:
+                known = {row[0] for row in self._db.execute(
+                    "SELECT piece FROM lines WHERE fingerprint = ? AND options = ?", (fingerprint, key))}
+                rows = [(fingerprint, key, piece, split_core(piece, options))
+                        for piece in pieces - known]
+                self._db.executemany("INSERT INTO lines VALUES (?, ?, ?, ?)", rows)
+                added += len(rows)
+            self._db.commit()
+        return added
+
+    def prune(self) -> int:
+        """Delete the rows left from other versions of the rules."""
+        current = _current_keys()
+        with self._lock:
+            stale = [row for row in self._db.execute("SELECT DISTINCT fingerprint, options FROM lines")
+                     if row not in current]
+            deleted = 0
+            for fingerprint, key in stale:
+                deleted += self._db.execute("DELETE FROM lines WHERE fingerprint = ? AND options = ?",
+                                            (fingerprint, key)).rowcount
+            self._db.commit()
+            self._db.execute("VACUUM")
+        return deleted
+
+    def __len__(self):
+        current = _current_keys()
+        with self._lock:
+            return sum(count for fingerprint, key, count in self._db.execute(
+                "SELECT fingerprint, options, COUNT(*) FROM lines GROUP BY fingerprint, options")
+                if (fingerprint, key) in current)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def all_core_options():
+    """One SplitOptions for every combination of the core flags."""
+    for flags in itertools.product((False, True), repeat=len(CORE_OPTIONS)):
+        yield SplitOptions(**dict(zip(CORE_OPTIONS, flags)))
+
+
+def _current_keys():
+    """The (fingerprint, options) pairs of the rows made with the rules as they are."""
+    return {(rules_fingerprint(options), options_key(options)) for options in all_core_options()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m palijuncture.store", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="add the lines of some texts to a store")
+    build.add_argument("store")
+    build.add_argument("files", nargs="+")
+    build.add_argument("--defaults-only", action="store_true",
+                       help="only the default core options instead of every combination")
+    prune = commands.add_parser("prune", help="delete rows made with other versions of the rules")
+    prune.add_argument("store")
+    args = parser.parse_args(argv)
+
+    store = SplitStore(args.store)
+    try:
+        if args.command == "build":
+            texts = []
+            for path in args.files:
+                with open(path, encoding="utf-8") as f:
+                    texts.append(f.read())
+            options_list = [SplitOptions()] if args.defaults_only else list(all_core_options())
+            added = store.build(texts, options_list)
+            print(f"{added} lines added, {len(store)} in {args.store}")
+        else:
+            print(f"{store.prune()} stale lines deleted from {args.store}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Split a text line by line without holding all of it in memory.
+
+:func:`split_lines` gives the same text as :func:`split_text` on the
+whole input, one output line at a time. This works because no rule
+reaches across a line break (see :mod:`palijuncture.memo`). Only three
+things need state that spans lines:
+
+* the line-initial cluster of the first line is rejoined at its first
+  occurrence, which may come on a later line;
+* the double juncture sign at the end belongs to the last line, so each
+  line is held back until the next one is read;
+* runs of three juncture signs are collapsed all through the text at the
+  end, which is done line by line, the same way.
+"""
+
+import itertools
+from typing import Iterable, Iterator, Optional
+
+from .engine import core_options, output_plan, render, run_step, split_core
+from .memo import _LINE_BREAK
+from .options import SplitOptions
+from .rules import END_OF_TEXT, FIRST_LETTERS, J
+
+
+def _segments(lines: Iterable[str]) -> Iterator[str]:
+    """The input re-cut into lines that each end with their line break."""
+    pending = ""
+    for chunk in lines:
+        pending += chunk
+        if "\n" not in chunk:
+            continue
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            yield line + "\n"
+    yield pending
+
+
+def split_lines(lines: Iterable[str], options: Optional[SplitOptions] = None, memo=None) -> Iterator[str]:
+    """Split an iterable of lines, such as an open file, lazily.
+
+    Lines keep their line breaks, as when reading a file; joining what is
+    yielded gives ``split_text("".join(lines), options)``. Each output
+    line ends with its line break, except the last. A
+    :class:`palijuncture.LineMemo` can be passed to reuse line splits.
+    """
+    if options is None:
+        options = SplitOptions()
+    segments = _segments(lines)
+    line = next(segments)
+    # What the whole-text split would see as text[:2]
+    yield from finish_lines(_core_lines(itertools.chain([line], segments), core_options(options), memo),
+                            line[:2], options)
+
+
+def core_lines(lines: Iterable[str], options: SplitOptions, memo=None) -> Iterator[str]:
+    """The first half of :func:`split_lines`: the core split, line by line.
+
+    The lines still have the internal juncture marker and no output stage
+    has run on them; :func:`finish_lines` does the rest, for any options
+    with the same core options.
+    """
+    return _core_lines(_segments(lines), core_options(options), memo)
+
+
+def _core_lines(segments: Iterable[str], core: SplitOptions, memo) -> Iterator[str]:
+    for index, line in enumerate(segments):
+        piece = ("\n" if index else "") + line
+        result = memo.split_piece(piece, core) if memo else split_core(piece, core)
+        yield result[len(_LINE_BREAK):] if index else result
+
+
+def finish_lines(cores: Iterable[str], first: str, options: SplitOptions) -> Iterator[str]:
+    """The second half of :func:`split_lines`: the output stages on each of :func:`core_lines`.
+
+    ``first`` is the first two letters of the text that was split.
+    """
+    plan = output_plan(options)
+    cores = iter(cores)
+    line = next(cores)
+    state = {"first": first, "rejoin_first": True, "empty": False}
+    index = 0
+    for following in cores:
+        yield render(finish_segment(line, False, plan, state), options)
+        line = following
+        index += 1
+    # Only an empty text has an empty core split: no core rule deletes anything
+    state["empty"] = index == 0 and line == ""
+    yield render(finish_segment(line, True, plan, state), options)
+
+
+def finish_segment(result: str, last: bool, plan, state: dict) -> str:
+    """Run the output stages of ``plan`` on the core split of one line.
+
+    ``state`` carries what spans lines: ``first`` (the first two letters
+    of the text), ``rejoin_first`` (their cluster is still to be rejoined)
+    and ``empty`` (the whole text is empty).
+    """
+    for step in plan:
+        if step.kind == FIRST_LETTERS:
+            if state["rejoin_first"]:
+                rejoined = run_step(step, result, state["first"])
+                if rejoined != result:
+                    state["rejoin_first"] = False
+                result = rejoined
+        elif step.kind == END_OF_TEXT:
+            if state["empty"]:
+                continue
+            if last:
+                result += J + J
+            result = result.replace(J * 3, J * 2)
+            result = result.replace(J * 3, J * 2)
+        else:
+            result = run_step(step, result, "")
+    return result
@@ -0,0 +1,267 @@
+"""Split uploaded files in the background, a chunk at a time.
+
+Book-length texts are too much for a text box: browsers cut long pastes
+short, and every keystroke reruns the page on all of it. An uploaded file
+is instead read in chunks of :data:`CHUNK_SIZE`, fed to
+:func:`palijuncture.split_lines` on a background thread and written to a
+temporary file, while the page polls :class:`UploadSplit` for progress.
+
+Sources (by extension):
+
+* ``.txt`` and ``.md``: the text itself, UTF-8 (a byte order mark is
+  dropped, and ``\\r\\n`` line ends become ``\\n``);
+* ``.xml``: the text of each paragraph-like element (``p``, ``head``,
+  ``l``, ... and elements with no child elements) on a line of its own,
+  read with an incremental parser, in whatever encoding the file declares
+  (the VRI Tipiṭaka files are UTF-16);
+* ``.json``: every string in the document, in order, each on a line of
+  its own, such as the segments of a SuttaCentral bilara file.
+
+Size limits and memory: Streamlit holds an upload in memory as it
+arrives, so the file itself costs its size once, up to
+:data:`MAX_UPLOAD_MB` (Streamlit's own ``server.maxUploadSize`` default).
+Text and XML are then split with only one chunk and the longest line
+in memory besides; the split text goes to disk.
+
+Only the core split is written, so the file serves every set of options
+with the same core options: the output stages and the juncture sign are
+applied line by line as it is read back (:meth:`UploadSplit.open`). JSON has no incremental
+parser in the standard library and is parsed whole, at several times its
+size, so it has the lower :data:`MAX_JSON_MB`. ``benchmarks/upload.py``
+checks both peaks.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+import xml.etree.ElementTree as ElementTree
+from typing import BinaryIO, Iterator, Optional
+
+from .engine import core_options
+from .options import SplitOptions
+from .stream import core_lines, finish_lines
+
+EXTENSIONS = ("txt", "md", "json", "xml")
+CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_MB = 200
+MAX_JSON_MB = 20
+# Elements whose text is one paragraph (or verse line) of the source
+XML_BLOCKS = {"p", "head", "l", "lg", "line", "title", "trailer", "verse", "item"}
+
+
+class Counted(io.RawIOBase):
+    """A binary file that counts the bytes read from it, for progress."""
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.file.read(len(buffer))
+        buffer[:len(data)] = data
+        self.count += len(data)
+        return len(data)
+
+
+def _text_chunks(file: BinaryIO, chunk_size: int) -> Iterator[str]:
+    text = io.TextIOWrapper(io.BufferedReader(file, chunk_size), encoding="utf-8-sig", newline=None)
+    while True:
+        chunk = text.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _local_name(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _xml_chunks(file: BinaryIO, chunk_size: int) -> Iterator[str]:
+    parser = ElementTree.XMLPullParser(("start", "end"))
+    stack = []  # for each open element: [element, is it a block, has it children]
+    in_block = 0
+    while True:
+        data = file.read(chunk_size)
+        if data:
+            parser.feed(data)
+        else:
+            parser.close()
+        for event, element in parser.read_events():
+            if event == "start":
+                if stack:
+                    stack[-1][2] = True
+                block = _local_name(element.tag) in XML_BLOCKS and not in_block
+                stack.append([element, block, False])
+                in_block += block
+                continue
+            _, block, has_children = stack.pop()
+            in_block -= block
+            if in_block:
+                continue  # part of a block, read with it
+            if block or not has_children:
+                text = " ".join("".join(element.itertext()).split())
+                if text:
+                    yield text + "\n"
+            # Drop what has been read, so only the open elements stay in memory
+            if stack:
+                stack[-1][0].remove(element)
+        if not data:
+            return
+
+
+def _json_strings(value) -> Iterator[str]:
+    if isinstance(value, str):
+        text = " ".join(value.split())
+        if text:
+            yield text + "\n"
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _json_strings(item)
+
+
+def _json_chunks(file: BinaryIO, chunk_size: int) -> Iterator[str]:
+    yield from _json_strings(json.load(io.TextIOWrapper(file, encoding="utf-8-sig")))
+
+
+READERS = {"txt": _text_chunks, "md": _text_chunks, "xml": _xml_chunks, "json": _json_chunks}
+
+
+def extension(name: str) -> str:
+    return os.path.splitext(name)[1].lower().lstrip(".")
+
+
+def check_upload(name: str, size: int):
+    """Raise ValueError if a file of ``size`` bytes called ``name`` cannot be split."""
+    kind = extension(name)
+    if kind not in READERS:
+        raise ValueError(f"{name}: only {', '.join('.' + e for e in EXTENSIONS)} files can be split")
+    limit = MAX_JSON_MB if kind == "json" else MAX_UPLOAD_MB
+    if size > limit * 2 ** 20:
+        raise ValueError(f"{name}: {size / 2 ** 20:,.0f} MB is over the {limit} MB limit for .{kind} files")
+
+
+def source_chunks(file: BinaryIO, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """The text of the uploaded ``file`` in chunks, read according to the extension of ``name``."""
+    return READERS[extension(name)](file, chunk_size)
+
+
+class UploadSplit:
+    """One uploaded file being split into a temporary file on a background thread.
+
+    ``done`` is set when the thread has finished; then either ``error`` is
+    set or the core split is in the file at ``path``. :meth:`cancel` stops
+    the thread at the next chunk and removes the file; so does an error,
+    and the file goes at the latest when the job is garbage collected
+    (e.g. with the session that uploaded it) or the process exits.
+    """
+
+    def __init__(self, file: BinaryIO, name: str, size: int, options: Optional[SplitOptions] = None,
+                 memo=None, chunk_size: int = CHUNK_SIZE):
+        check_upload(name, size)
+        self.name = name
+        self.size = size
+        self.options = options or SplitOptions()
+        self.lines = 0
+        # The first two letters of the text, which the output stages need
+        self.first = ""
+        self.error: Optional[str] = None
+        self.done = threading.Event()
+        self._cancelled = threading.Event()
+        file.seek(0)
+        self._input = Counted(file)
+        self._memo = memo
+        self._chunk_size = chunk_size
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        out = tempfile.NamedTemporaryFile("w", encoding="utf-8", prefix="palijuncture-", suffix=".txt", delete=False)
+        out.close()
+        self.path = out.name
+        self._removed = weakref.finalize(self, _remove, self.path)
+        self._thread = threading.Thread(target=self._run, name=f"split {name}", daemon=True)
+        self._thread.start()
+
+    def _chunks(self) -> Iterator[str]:
+        for chunk in source_chunks(self._input, self.name, self._chunk_size):
+            if self._cancelled.is_set():
+                raise InterruptedError("cancelled")
+            if len(self.first) < 2:
+                self.first += chunk[:2 - len(self.first)]
+            yield chunk
+
+    def _run(self):
+        try:
+            with open(self.path, "w", encoding="utf-8", newline="\n") as out:
+                for line in core_lines(self._chunks(), self.options, self._memo):
+                    out.write(line)
+                    self.lines += 1
+        except InterruptedError:
+            pass
+        except (UnicodeDecodeError, ElementTree.ParseError, ValueError) as e:
+            self.error = f"{self.name} could not be read: {e}"
+        except RecursionError:
+            self.error = f"{self.name} could not be read: it is nested too deeply"
+        except Exception as e:  # e.g. the disk is full; the page must not wait forever
+            self.error = f"{self.name} could not be split: {type(e).__name__}: {e}"
+        finally:
+            self.elapsed = time.perf_counter() - self.started
+            if self.error or self._cancelled.is_set():
+                self.remove()
+            self.done.set()
+
+    @property
+    def progress(self) -> float:
+        """The share of the file read so far, from 0 to 1."""
+        if self.done.is_set():
+            return 1.0
+        return min(self._input.count / self.size, 1.0) if self.size else 0.0
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.done.is_set():
+            self.remove()
+
+    def remove(self):
+        self._removed()
+
+    @contextlib.contextmanager
+    def open(self, options: Optional[SplitOptions] = None):
+        """The split text with ``options`` (by default the job's), line by line.
+
+        ``options`` must have the same core options as the job.
+        """
+        if options is None:
+            options = self.options
+        if core_options(options) != core_options(self.options):
+            raise ValueError("these options need the text split again")
+        with open(self.path, encoding="utf-8", newline="\n") as f:
+            yield finish_lines(_file_lines(f), self.first, options)
+
+
+def _file_lines(f) -> Iterator[str]:
+    """The lines of ``f`` as they were written, with the empty one after a last line break."""
+    line = "\n"
+    for line in f:
+        yield line
+    if line.endswith("\n"):
+        yield ""
+
+
+def _remove(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
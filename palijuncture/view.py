@@ -0,0 +1,59 @@
+"""A window onto a long split text, for showing it a page at a time.
+
+Tens of thousands of split lines written to the page at once make the
+browser and the websocket messages huge. For long texts the page keeps
+the split lines on the server and shows :data:`PAGE_LINES` of them at a
+time, with jumping to a line and searching; the whole text is still
+there to download.
+"""
+
+import os
+import tempfile
+from typing import BinaryIO, Iterable, List, Sequence
+
+from .export import export
+
+# Texts with more lines than this are shown a page at a time
+WINDOW_LINES = 1000
+PAGE_LINES = 200
+MAX_MATCHES = 100
+
+
+def page_start(line: int, line_count: int, page_lines: int = PAGE_LINES) -> int:
+    """The first line (counting from 0) of the page that shows ``line``, clamped to the text."""
+    line = max(0, min(line, line_count - 1))
+    return line - line % page_lines
+
+
+def find_lines(query: str, *columns: Sequence[str], limit: int = MAX_MATCHES) -> List[int]:
+    """The numbers (from 0) of the lines where ``query`` occurs, ignoring case.
+
+    Each of ``columns`` is a list of lines of the same length, e.g. the
+    input lines and the split lines; a line matches if it matches in any.
+    """
+    query = query.casefold()
+    if not query:
+        return []
+    found = []
+    for number, lines in enumerate(zip(*columns)):
+        if any(query in line.casefold() for line in lines):
+            found.append(number)
+            if len(found) >= limit:
+                break
+    return found
+
+
+def download_file(lines: Iterable[str], fmt: str = "txt", title: str = "Split Pāḷi text") -> BinaryIO:
+    """A file for reading, with the ``lines`` exported into it as ``fmt``.
+
+    The text is exported line by line into a temporary file, so a long text
+    is never held a second time as one string or one bytes object.
+    """
+    with tempfile.NamedTemporaryFile("wb", prefix="palijuncture-", delete=False) as out:
+        export(lines, out, fmt, title)
+    reader = open(out.name, "rb")
+    try:
+        os.unlink(out.name)  # gone once the reader is closed
+    except OSError:  # Windows does not remove open files
+        pass
+    return reader
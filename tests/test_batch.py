@@ -0,0 +1,25 @@
+import os
+
+from palijuncture import split_text
+from palijuncture.batch import main
+
+
+def test_a_file_that_is_not_utf8_is_skipped(tmp_path):
+    (tmp_path / "a.txt").write_text("Evaṃ me sutaṃ\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_bytes(b"bad \xff\xfe text\n")
+    (tmp_path / "c.txt").write_text("Namo tassa\n", encoding="utf-8")
+    assert main([str(tmp_path), "--jobs", "1", "--quiet"]) == 1
+    assert not os.path.exists(tmp_path / "b.split.txt")
+    assert (tmp_path / "c.split.txt").read_text(encoding="utf-8") == split_text("Namo tassa\n")
+
+
+def test_output_into_the_input_directory_leaves_the_input_alone(tmp_path):
+    (tmp_path / "a.txt").write_text("Evaṃ me sutaṃ\n", encoding="utf-8")
+    assert main([str(tmp_path), "--output", str(tmp_path), "--jobs", "1", "--quiet"]) == 1
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "Evaṃ me sutaṃ\n"
+
+
+def test_an_empty_suffix_leaves_the_input_alone(tmp_path):
+    (tmp_path / "a.txt").write_text("Evaṃ me sutaṃ\n", encoding="utf-8")
+    assert main([str(tmp_path / "a.txt"), "--suffix", "", "--jobs", "1", "--quiet"]) == 1
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "Evaṃ me sutaṃ\n"
@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from palijuncture import SplitCache, SplitOptions, dispatch
+from palijuncture.dispatch import Busy, SplitDispatcher
+
+
+def die(work, options):
+    os._exit(1)
+
+
+def test_a_failed_submit_gives_back_its_slot(monkeypatch):
+    def start_pool(*args):
+        raise OSError("no more processes")
+
+    monkeypatch.setattr(dispatch, "start_pool", start_pool)
+    dispatcher = SplitDispatcher(SplitCache(), workers=1, threshold=1, max_pending=1)
+    for _ in range(3):
+        with pytest.raises(OSError):
+            dispatcher.split("Evaṃ me sutaṃ")
+    assert dispatcher.stats()["in_pool"] == 0
+
+
+def test_a_dead_worker_is_reported_and_replaced():
+    dispatcher = SplitDispatcher(SplitCache(), workers=1, threshold=1)
+    try:
+        with pytest.raises(Busy, match="stopped"):
+            dispatcher._dispatch("", None, die, "Evaṃ me sutaṃ", SplitOptions())
+        assert dispatcher._pool is None
+        assert dispatcher.split("Evaṃ me sutaṃ") == SplitCache().split("Evaṃ me sutaṃ")
+    finally:
+        dispatcher.shutdown()
@@ -0,0 +1,26 @@
+import io
+import zipfile
+from xml.dom import minidom
+
+import pytest
+
+from palijuncture.export import export
+
+LINES = ["Evaṃ me sutaṃ\x0c  \n", "ekaṃ\x00 samayaṃ \x1b< bhagavā  \n"]
+
+
+@pytest.mark.parametrize("fmt,member", [("odt", "content.xml"), ("epub", "OEBPS/text0001.xhtml")])
+def test_control_characters_do_not_break_the_xml(fmt, member):
+    out = io.BytesIO()
+    export(LINES, out, fmt, title="Sutta\x0c")
+    with zipfile.ZipFile(out) as archive:
+        document = minidom.parseString(archive.read(member))
+    text = document.documentElement.toxml()
+    assert "Evaṃ me sutaṃ" in text and "samayaṃ &lt; bhagavā" in text
+
+
+def test_html_has_no_control_characters():
+    out = io.BytesIO()
+    export(LINES, out, "html")
+    page = out.getvalue().decode("utf-8")
+    assert not any(ord(c) < 32 and c not in "\t\n\r" for c in page)
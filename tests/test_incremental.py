@@ -0,0 +1,23 @@
+from palijuncture import LineMemo, SplitOptions, split_text
+from palijuncture.engine import core_options
+from palijuncture.incremental import LineSplits
+
+TEXT = "Evaṃ me sutaṃ.\nEkaṃ samayaṃ bhagavā\nsāvatthiyaṃ viharati\nEvaṃ me sutaṃ.\n"
+
+
+def test_iter_split_goes_through_the_line_memo():
+    memo = LineMemo()
+    options = SplitOptions(uppercase=True)
+    lines = LineSplits().iter_split(TEXT, options, split_pieces=memo.split_pieces)
+    assert "".join(lines) == split_text(TEXT, options)
+    assert memo.stats()["misses"] == 5
+    # Another session splitting the same text finds every line
+    assert "".join(LineSplits().iter_split(TEXT, options, split_pieces=memo.split_pieces)) == split_text(TEXT, options)
+    assert memo.stats()["hits"] == 5
+
+
+def test_split_pieces_is_split_piece_for_each():
+    memo = LineMemo()
+    options = core_options(SplitOptions())
+    pieces = list(LineMemo.pieces(TEXT)) * 2
+    assert memo.split_pieces(pieces, options) == [LineMemo().split_piece(piece, options) for piece in pieces]
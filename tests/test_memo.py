@@ -0,0 +1,13 @@
+from palijuncture import LineMemo, SplitOptions
+from palijuncture.engine import core_options, split_core
+
+TEXT = "\n".join(f"Buddhaṃ saraṇaṃ gacchāmi {i}." for i in range(500))
+
+
+def test_memo_stays_under_its_byte_cap():
+    memo = LineMemo(max_bytes=20_000)
+    options = core_options(SplitOptions())
+    assert memo.split_core(TEXT, options) == split_core(TEXT, options)
+    stats = memo.stats()
+    assert 0 < stats["bytes"] <= 20_000
+    assert stats["lines"] < 500
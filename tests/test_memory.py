@@ -0,0 +1,15 @@
+import pytest
+
+from memory import MAX_RATIO, STANZA, peak_ratio
+from palijuncture import SplitOptions
+
+TEXT = STANZA * (2 ** 18 // len(STANZA.encode("utf-8")))
+
+
+@pytest.mark.parametrize("options", [
+    SplitOptions(),
+    SplitOptions(uppercase=True, show_punctuation=True),
+    SplitOptions(samyoga_pauses=True, transliteration="velthuis"),
+])
+def test_peak_is_a_small_multiple_of_the_input(options):
+    assert peak_ratio(TEXT, options) <= MAX_RATIO
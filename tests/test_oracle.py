@@ -0,0 +1,28 @@
+import pytest
+
+import oracle
+
+
+@pytest.mark.parametrize("candidate", ["split_text", "split_lines", "line_memo"])
+def test_same_as_the_original_chain(candidate):
+    assert oracle.main(["--quick", "--cases", "200", "--candidate", candidate]) == 0
+
+
+def test_a_mismatch_is_shrunk():
+    def wrong(text, options):
+        return oracle.split_text(text, options).replace("ā", "a")
+
+    case = oracle.shrink(oracle.Case("Evaṃ me sutaṃ.\nEkaṃ samayaṃ bhagavā\n", oracle.SplitOptions(uppercase=True)),
+                         wrong)
+    assert case == oracle.Case("ā", oracle.SplitOptions())
+
+
+def test_a_sign_the_rules_also_use_is_a_known_deviation():
+    text = "Evaṃ me sutaṃ ekaṃ samayaṃ bhagavā"
+    options = oracle.SplitOptions(juncture_sign="?")
+    assert oracle.legacy_split(text, options) != oracle.split_text(text, options)
+    assert oracle.known_deviation(text, options) == oracle.KNOWN_DEVIATIONS[-1][0]
+    # What the engine does instead: the chain's split with the sign put in at the end
+    neutral = oracle.replace(options, juncture_sign=oracle.NEUTRAL_SIGN)
+    assert oracle.legacy_split(text, neutral).replace(oracle.NEUTRAL_SIGN, "?") == oracle.split_text(text, options)
+    assert oracle.known_deviation(text, oracle.SplitOptions(juncture_sign="|")) is None
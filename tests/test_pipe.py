@@ -0,0 +1,21 @@
+import io
+import json
+
+from palijuncture import split_text
+from palijuncture.pipe import run
+
+RECORDS = [
+    '{"id": 1, "text": "Evaṃ me", "options": {"juncture_sign": 5}}',
+    '{"id": 2, "text": "Evaṃ me", "options": {"uppercase": [1]}}',
+    'not json',
+    '{"id": 4, "text": "Evaṃ me"}',
+]
+
+
+def test_bad_records_are_answered_and_the_stream_goes_on():
+    out = io.StringIO()
+    assert run(RECORDS, out) == 4
+    answers = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [answer["id"] for answer in answers] == [1, 2, None, 4]
+    assert all("error" in answer for answer in answers[:3])
+    assert answers[3]["split"] == split_text("Evaṃ me")
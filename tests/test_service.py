@@ -0,0 +1,66 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from palijuncture import pool, split_text
+from palijuncture.service import Batcher, HTTPError, Service
+
+
+def serve(body: dict, monkeypatch):
+    real = pool.timed_split
+
+    def timed_split(text, options):
+        if text == "boom":
+            raise RuntimeError("boom")
+        return real(text, options)
+
+    monkeypatch.setattr(pool, "timed_split", timed_split)
+
+    async def go():
+        with ThreadPoolExecutor(1) as executor:
+            service = Service(Batcher(executor, wait_ms=50))
+            return await service.respond("POST", "/split/batch", json.dumps(body).encode())
+
+    return asyncio.run(go())
+
+
+def test_one_failing_item_does_not_fail_the_batch(monkeypatch):
+    items = [{"id": 1, "text": "Evaṃ me"}, {"id": 2, "text": "boom"}, {"id": 3, "text": "sutaṃ"}]
+    status, answer = serve({"items": items}, monkeypatch)
+    assert status == 200
+    results = answer["results"]
+    assert [result["id"] for result in results] == [1, 2, 3]
+    assert results[0]["split"] == split_text("Evaṃ me")
+    assert results[1]["error"] == "RuntimeError: boom"
+    assert results[2]["split"] == split_text("sutaṃ")
+
+
+def test_options_of_the_wrong_type_are_refused(monkeypatch):
+    with pytest.raises(HTTPError) as refused:
+        serve({"items": [{"text": "Evaṃ me", "options": {"uppercase": "yes"}}]}, monkeypatch)
+    assert refused.value.status == 400
+
+
+def exchange(request: bytes) -> bytes:
+    async def go():
+        service = Service(Batcher(None))
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(request)
+            answer = await reader.read()
+            writer.close()
+            return answer
+
+    return asyncio.run(go())
+
+
+@pytest.mark.parametrize("request_bytes,status", [
+    (b"POST /split HTTP/1.1\r\nContent-Length: -1\r\n\r\n", b"400"),
+    (b"POST /split HTTP/1.1\r\nX-Long: " + b"a" * 2 ** 17 + b"\r\n\r\n", b"431"),
+    (b"GET /" + b"a" * 2 ** 17 + b" HTTP/1.1\r\n\r\n", b"400"),
+], ids=["negative length", "long header", "long request line"])
+def test_malformed_requests_get_an_answer(request_bytes, status):
+    assert exchange(request_bytes).startswith(b"HTTP/1.1 " + status)
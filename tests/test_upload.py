@@ -0,0 +1,62 @@
+import io
+import json
+import os
+
+import pytest
+
+from palijuncture import SplitOptions, split_text
+from palijuncture.upload import MAX_JSON_MB, MAX_UPLOAD_MB, UploadSplit, check_upload
+
+TEXT = "Evaṃ me sutaṃ.\n\nEkaṃ samayaṃ bhagavā sāvatthiyaṃ viharati.\n"
+
+
+def upload(data: bytes, name: str = "sutta.txt", options=None) -> UploadSplit:
+    job = UploadSplit(io.BytesIO(data), name, len(data), options)
+    job.wait()
+    return job
+
+
+@pytest.mark.parametrize("name,size", [
+    ("sutta.txt", MAX_UPLOAD_MB * 2 ** 20 + 1),
+    ("sutta.json", MAX_JSON_MB * 2 ** 20 + 1),
+    ("sutta.pdf", 10),
+])
+def test_refused(name, size):
+    with pytest.raises(ValueError, match=name):
+        check_upload(name, size)
+
+
+def test_at_the_limits():
+    check_upload("sutta.md", MAX_UPLOAD_MB * 2 ** 20)
+    check_upload("sutta.json", MAX_JSON_MB * 2 ** 20)
+
+
+@pytest.mark.parametrize("text", ["", "\n", TEXT, TEXT.rstrip("\n"), "khandha\nEvaṃ"])
+def test_one_split_serves_every_output_option(text):
+    job = upload(text.encode("utf-8"))
+    for options in (SplitOptions(), SplitOptions(juncture_sign="|", transliteration="velthuis", hide_hyphens=True)):
+        with job.open(options) as lines:
+            assert "".join(lines) == split_text(text, options)
+    with pytest.raises(ValueError):
+        job.open(SplitOptions(uppercase=True)).__enter__()
+    job.remove()
+    assert not os.path.exists(job.path)
+
+
+def test_a_file_that_cannot_be_read_gets_an_error_and_leaves_nothing():
+    job = upload(b"\xff\xfe not utf-8")
+    assert job.error.startswith("sutta.txt could not be read")
+    assert not os.path.exists(job.path)
+
+
+def test_json_nested_too_deeply_gets_an_error():
+    data = ("[" * 100_000 + "]" * 100_000).encode()
+    job = upload(data, "deep.json")
+    assert job.error is not None
+    assert not os.path.exists(job.path)
+
+
+def test_json_strings_are_lines():
+    job = upload(json.dumps({"a": "Evaṃ me sutaṃ.", "b": ["Ekaṃ samayaṃ"]}).encode(), "sutta.json")
+    with job.open() as lines:
+        assert "".join(lines) == split_text("Evaṃ me sutaṃ.\nEkaṃ samayaṃ\n")